@@ -47,72 +47,73 @@ CLI usage:
     python -m harness server --port 8080
 """
 
-__version__ = "0.1.0"
-
-from .core.llm_harness import (
-    UniversalLLMHarness,
-    HarnessMode,
-    LLMType,
-    LLMBackend,
-    MockLLMBackend,
-    AgentState,
-    ExecutionContext,
-    CommandExecutor,
-    create_harness
-)
+import importlib
+import types
 
-from .core.command_protocol import (
-    Command,
-    CommandResult,
-    CommandType,
-    UniversalCommandParser,
-    generate_help_text
-)
+from ._version import __version__
 
-from .sandbox.sandbox_manager import (
-    SandboxManager,
-    Sandbox,
-    SandboxType,
-    SandboxSnapshot,
-    ResourceLimits,
-    IsolationLevel
-)
+# Public names are resolved on first access (PEP 562) so that importing a
+# single symbol does not pull in every subsystem.
+_LAZY = types.MappingProxyType({
+    # Core harness
+    "UniversalLLMHarness": ".core.llm_harness",
+    "HarnessMode": ".core.llm_harness",
+    "LLMType": ".core.llm_harness",
+    "LLMBackend": ".core.backend",
+    "MockLLMBackend": ".core.llm_harness",
+    "AgentState": ".core.llm_harness",
+    "ExecutionContext": ".core.llm_harness",
+    "CommandExecutor": ".core.llm_harness",
+    "create_harness": ".core.llm_harness",
 
-from .skills.skill_system import (
-    SkillRegistry,
-    Skill,
-    SkillResult,
-    SkillMetadata,
-    SkillParameter,
-    SkillOutput,
-    SkillType,
-    SkillCategory,
-    PythonSkill,
-    PromptSkill,
-    CompositeSkill
-)
+    # Commands
+    "Command": ".core.command_protocol",
+    "CommandResult": ".core.command_protocol",
+    "CommandType": ".core.command_protocol",
+    "UniversalCommandParser": ".core.command_protocol",
+    "generate_help_text": ".core.command_protocol",
 
-from .marketplace.registry import (
-    AgentDirectory,
-    Marketplace,
-    AgentProfile,
-    AgentCapabilityLevel,
-    MarketplaceAsset,
-    AssetType
-)
+    # Sandbox
+    "SandboxManager": ".sandbox.sandbox_manager",
+    "Sandbox": ".sandbox.sandbox_manager",
+    "SandboxType": ".sandbox.sandbox_manager",
+    "SandboxSnapshot": ".sandbox.sandbox_manager",
+    "ResourceLimits": ".sandbox.sandbox_manager",
+    "IsolationLevel": ".sandbox.sandbox_manager",
 
-from .communication.message_bus import (
-    MessageBus,
-    Message,
-    MessageType,
-    MessagePriority,
-    AgentMailbox,
-    Conversation,
-    TextMessageParser,
-    format_inbox_for_llm
-)
+    # Skills
+    "SkillRegistry": ".skills.skill_system",
+    "Skill": ".skills.skill_system",
+    "SkillResult": ".skills.skill_system",
+    "SkillMetadata": ".skills.skill_system",
+    "SkillParameter": ".skills.skill_system",
+    "SkillOutput": ".skills.skill_system",
+    "SkillType": ".skills.skill_system",
+    "SkillCategory": ".skills.skill_system",
+    "PythonSkill": ".skills.skill_system",
+    "PromptSkill": ".skills.skill_system",
+    "CompositeSkill": ".skills.skill_system",
+
+    # Marketplace
+    "AgentDirectory": ".marketplace.registry",
+    "Marketplace": ".marketplace.registry",
+    "AgentProfile": ".marketplace.registry",
+    "AgentCapabilityLevel": ".marketplace.registry",
+    "MarketplaceAsset": ".marketplace.registry",
+    "AssetType": ".marketplace.registry",
 
-__all__ = [
+    # Communication
+    "MessageBus": ".communication.message_bus",
+    "Message": ".communication.message_bus",
+    "MessageType": ".communication.message_bus",
+    "MessagePriority": ".communication.message_bus",
+    "AgentMailbox": ".communication.message_bus",
+    "Conversation": ".communication.message_bus",
+    "TextMessageParser": ".communication.message_bus",
+    "format_inbox_for_llm": ".communication.message_bus",
+})
+
+__all__ = (
     # Core harness
     "UniversalLLMHarness",
     "HarnessMode",
@@ -169,4 +170,18 @@ __all__ = [
     "Conversation",
     "TextMessageParser",
     "format_inbox_for_llm",
-]
+)
+
+
+def __getattr__(name):
+    """Lazily import public names from their defining submodule."""
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
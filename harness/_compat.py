@@ -0,0 +1,54 @@
+"""
+Small helpers shared across the harness subsystems.
+
+Dataclass options that depend on the interpreter version, the nanosecond
+timestamp used by high-volume records, and the revision counter registries
+expose so callers can cache views of them.
+"""
+
+import sys
+import time
+from dataclasses import field
+from datetime import datetime
+
+__all__ = (
+    "DATACLASS_SLOTS",
+    "timestamp_ns_field",
+    "NanosecondTimestamp",
+    "RevisionCounter",
+)
+
+# Records created per command, message or turn drop the per-instance __dict__
+# where the interpreter supports it (3.10+): use as @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def timestamp_ns_field():
+    """Dataclass field defaulting to nanoseconds since the epoch.
+
+    Cheaper than datetime.now() for records created on every call.
+    """
+    return field(default_factory=time.time_ns)
+
+
+class NanosecondTimestamp:
+    """Mixin for dataclasses holding a ``timestamp`` in epoch nanoseconds"""
+
+    __slots__ = ()
+
+    @property
+    def timestamp_dt(self) -> datetime:
+        """The timestamp as a datetime, for display and serialization"""
+        return datetime.fromtimestamp(self.timestamp / 1e9)
+
+
+class RevisionCounter:
+    """Mixin for registries whose views are cached by consumers.
+
+    ``revision`` changes on every mutation; bump it under the registry's lock.
+    """
+
+    revision = 0
+
+    def _bump_revision(self):
+        self.revision += 1
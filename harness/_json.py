@@ -0,0 +1,68 @@
+"""
+JSON encoding and decoding shared by the whole package.
+
+orjson is used when it is installed. The stdlib fallback is configured to
+produce the same document, so output does not depend on which backend is
+present: compact separators, non-ASCII text left unescaped, and orjson's
+native types (datetimes, enums, UUIDs, dataclasses) encoded the way orjson
+encodes them. Inputs orjson rejects, such as non-string keys, go through
+the stdlib encoder.
+"""
+
+import json
+import uuid
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ("json_loads", "json_dumps", "json_dumps_bytes")
+
+
+def _default(obj: Any) -> Any:
+    """Encode the types orjson handles natively, for the stdlib encoder"""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document from str or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 JSON"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return _stdlib_dumps(obj).encode()
+
+
+def json_dumps(obj: Any) -> str:
+    """Encode obj as a compact JSON string"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass
+    return _stdlib_dumps(obj)
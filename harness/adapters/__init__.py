@@ -25,7 +25,9 @@ Quick Start:
 
 import os
 import logging
-from typing import Optional, Dict, Any
+import importlib
+import types
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
 # Base classes and utilities
 from .base import (
@@ -46,8 +48,8 @@ from .base import (
     convert_tools_to_anthropic_format,
 )
 
-# Re-export LLMBackend from core for compatibility
-from ..core.llm_harness import LLMBackend
+if TYPE_CHECKING:
+    from ..core.backend import LLMBackend
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +58,18 @@ logger = logging.getLogger(__name__)
 # Lazy imports for backends (avoid import errors if dependencies missing)
 # ============================================================================
 
+# name -> (module, attribute). LLMBackend is re-exported from core for
+# compatibility; resolving it lazily keeps the core harness out of the
+# import path for callers that only need a concrete backend.
+_LAZY = types.MappingProxyType({
+    "LLMBackend": ("harness.core.backend", "LLMBackend"),
+    "AnthropicBackend": ("harness.adapters.anthropic_backend", "AnthropicBackend"),
+    "OpenAIBackend": ("harness.adapters.openai_backend", "OpenAIBackend"),
+    "OpenRouterBackend": ("harness.adapters.openrouter_backend", "OpenRouterBackend"),
+    "OllamaBackend": ("harness.adapters.ollama_backend", "OllamaBackend"),
+})
+
+
 def _import_anthropic_backend():
     """Lazily import AnthropicBackend."""
     from .anthropic_backend import AnthropicBackend
@@ -89,7 +103,7 @@ def create_backend(
     model: Optional[str] = None,
     api_key: Optional[str] = None,
     **kwargs
-) -> LLMBackend:
+) -> "LLMBackend":
     """
     Create a backend for the specified provider.
 
@@ -185,7 +199,7 @@ def create_backend(
         )
 
 
-def create_backend_from_env() -> LLMBackend:
+def create_backend_from_env() -> "LLMBackend":
     """
     Create a backend based on available environment variables.
 
@@ -270,7 +284,7 @@ def list_available_providers() -> Dict[str, bool]:
 # Exports
 # ============================================================================
 
-__all__ = [
+__all__ = (
     # Base classes
     "LLMBackend",
     "BaseLLMBackend",
@@ -303,18 +317,15 @@ __all__ = [
     "create_backend",
     "create_backend_from_env",
     "list_available_providers",
-]
+)
 
 
 # Lazy class references for convenient imports
 def __getattr__(name):
     """Lazy load backend classes."""
-    if name == "AnthropicBackend":
-        return _import_anthropic_backend()
-    elif name == "OpenAIBackend":
-        return _import_openai_backend()
-    elif name == "OpenRouterBackend":
-        return _import_openrouter_backend()
-    elif name == "OllamaBackend":
-        return _import_ollama_backend()
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    spec = _LAZY.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(spec[0]), spec[1])
+    globals()[name] = value
+    return value
@@ -7,10 +7,13 @@ Supports multiple providers, model families, and capabilities.
 
 import os
 import logging
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Any, Optional, Iterator, Callable
+from typing import List, Dict, Any, Optional, Iterator, Callable, Tuple
+
+from .._json import json_loads as _json_loads
+from ..core.backend import LLMBackend
 
 logger = logging.getLogger(__name__)
 
@@ -466,7 +469,7 @@ class GenerateResponse:
         }
 
 
-class BaseLLMBackend(ABC):
+class BaseLLMBackend(LLMBackend):
     """
     Enhanced base class for LLM backends.
 
@@ -604,45 +607,79 @@ class BaseLLMBackend(ABC):
 # Tool Format Converters
 # ============================================================================
 
+# Converted tools keyed by id() of the generic definition. The harness passes
+# the same definition dicts on every generation step, so each one is
+# converted once; the entry keeps a reference to its source so the id stays
+# valid and can be checked with ``is``. Definitions are treated as immutable
+# once converted.
+_TOOL_CACHE_SIZE = 256
+_openai_tool_cache: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+_anthropic_tool_cache: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
+
+def _convert_tool_cached(
+    cache: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]],
+    tool: Dict[str, Any],
+    convert: Callable[[Dict[str, Any]], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Return the cached conversion of a tool, converting it on first use."""
+    entry = cache.get(id(tool))
+    if entry is not None and entry[0] is tool:
+        return entry[1]
+    converted = convert(tool)
+    if len(cache) >= _TOOL_CACHE_SIZE:
+        cache.clear()
+    cache[id(tool)] = (tool, converted)
+    return converted
+
+
+def _to_openai_tool(tool: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "type": "function",
+        "function": {
+            "name": tool["name"],
+            "description": tool.get("description", ""),
+            "parameters": tool.get("parameters", {"type": "object", "properties": {}})
+        }
+    }
+
+
+def _to_anthropic_tool(tool: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "name": tool["name"],
+        "description": tool.get("description", ""),
+        "input_schema": tool.get("parameters", {"type": "object", "properties": {}})
+    }
+
+
 def convert_tools_to_openai_format(tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Convert generic tool definitions to OpenAI format."""
-    openai_tools = []
-    for tool in tools:
-        openai_tool = {
-            "type": "function",
-            "function": {
-                "name": tool["name"],
-                "description": tool.get("description", ""),
-                "parameters": tool.get("parameters", {"type": "object", "properties": {}})
-            }
-        }
-        openai_tools.append(openai_tool)
-    return openai_tools
+    return [_convert_tool_cached(_openai_tool_cache, tool, _to_openai_tool) for tool in tools]
 
 
 def convert_tools_to_anthropic_format(tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Convert generic tool definitions to Anthropic format."""
-    anthropic_tools = []
-    for tool in tools:
-        anthropic_tool = {
-            "name": tool["name"],
-            "description": tool.get("description", ""),
-            "input_schema": tool.get("parameters", {"type": "object", "properties": {}})
-        }
-        anthropic_tools.append(anthropic_tool)
-    return anthropic_tools
+    return [_convert_tool_cached(_anthropic_tool_cache, tool, _to_anthropic_tool) for tool in tools]
+
+
+def parse_tool_arguments(arguments: Any) -> Any:
+    """Decode a tool call's JSON argument string; other values pass through."""
+    if not arguments:
+        return {}
+    if isinstance(arguments, (str, bytes)):
+        return _json_loads(arguments)
+    return arguments
 
 
 def parse_openai_tool_calls(tool_calls: Any) -> List[Dict[str, Any]]:
     """Parse OpenAI tool calls to generic format."""
-    import json
     result = []
     if tool_calls:
         for tc in tool_calls:
             result.append({
                 "id": getattr(tc, "id", ""),
                 "name": tc.function.name,
-                "arguments": json.loads(tc.function.arguments) if tc.function.arguments else {}
+                "arguments": parse_tool_arguments(tc.function.arguments)
             })
     return result
 
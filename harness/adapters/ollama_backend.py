@@ -12,6 +12,7 @@ from typing import List, Dict, Any, Optional, Iterator
 
 from .base import (
     BaseLLMBackend,
+    convert_tools_to_openai_format,
     ModelInfo,
     ModelCapability,
     OLLAMA_MODELS,
@@ -203,17 +204,8 @@ class OllamaBackend(BaseLLMBackend):
 
             # Add tools if provided and model supports them
             if tools and self._supports_tools_for_model():
-                # Convert to Ollama tool format (OpenAI-compatible)
-                ollama_tools = []
-                for tool in tools:
-                    ollama_tools.append({
-                        "type": "function",
-                        "function": {
-                            "name": tool["name"],
-                            "description": tool.get("description", ""),
-                            "parameters": tool.get("parameters", {"type": "object", "properties": {}})
-                        }
-                    })
+                # Ollama's tool format is OpenAI-compatible
+                ollama_tools = convert_tools_to_openai_format(tools)
                 request_kwargs["tools"] = ollama_tools
 
             # Make API call
@@ -283,16 +275,7 @@ class OllamaBackend(BaseLLMBackend):
 
             # Add tools if supported
             if tools and self._supports_tools_for_model():
-                ollama_tools = []
-                for tool in tools:
-                    ollama_tools.append({
-                        "type": "function",
-                        "function": {
-                            "name": tool["name"],
-                            "description": tool.get("description", ""),
-                            "parameters": tool.get("parameters", {"type": "object", "properties": {}})
-                        }
-                    })
+                ollama_tools = convert_tools_to_openai_format(tools)
                 payload["tools"] = ollama_tools
 
             # Make HTTP request
@@ -374,16 +357,7 @@ class OllamaBackend(BaseLLMBackend):
 
             # Add tools if provided and model supports them
             if tools and self._supports_tools_for_model():
-                ollama_tools = []
-                for tool in tools:
-                    ollama_tools.append({
-                        "type": "function",
-                        "function": {
-                            "name": tool["name"],
-                            "description": tool.get("description", ""),
-                            "parameters": tool.get("parameters", {"type": "object", "properties": {}})
-                        }
-                    })
+                ollama_tools = convert_tools_to_openai_format(tools)
                 request_kwargs["tools"] = ollama_tools
                 # Note: Ollama streaming with tools may not return tool calls inline
                 # Tool calls typically come at the end of the stream
@@ -423,16 +397,7 @@ class OllamaBackend(BaseLLMBackend):
 
             # Add tools if provided and model supports them
             if tools and self._supports_tools_for_model():
-                ollama_tools = []
-                for tool in tools:
-                    ollama_tools.append({
-                        "type": "function",
-                        "function": {
-                            "name": tool["name"],
-                            "description": tool.get("description", ""),
-                            "parameters": tool.get("parameters", {"type": "object", "properties": {}})
-                        }
-                    })
+                ollama_tools = convert_tools_to_openai_format(tools)
                 payload["tools"] = ollama_tools
                 logger.debug("HTTP streaming with tools enabled")
 
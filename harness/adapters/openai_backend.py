@@ -6,7 +6,6 @@ Supports both the new Responses API and legacy Chat Completions API.
 """
 
 import os
-import json
 import logging
 from typing import List, Dict, Any, Optional, Iterator
 from enum import Enum
@@ -15,6 +14,7 @@ from .base import (
     BaseLLMBackend,
     convert_tools_to_openai_format,
     parse_openai_tool_calls,
+    parse_tool_arguments,
 )
 
 logger = logging.getLogger(__name__)
@@ -285,7 +285,7 @@ class OpenAIBackend(BaseLLMBackend):
                             tool_calls.append({
                                 "id": getattr(item, 'call_id', ''),
                                 "name": item.name,
-                                "arguments": json.loads(item.arguments) if isinstance(item.arguments, str) else item.arguments
+                                "arguments": parse_tool_arguments(item.arguments)
                             })
             elif hasattr(response, 'output_text'):
                 content = response.output_text
@@ -6,13 +6,13 @@ OpenRouter acts as a gateway to models from OpenAI, Anthropic, Google, Meta, Mis
 """
 
 import os
-import json
 import logging
 from typing import List, Dict, Any, Optional, Iterator
 
 from .base import (
     BaseLLMBackend,
     convert_tools_to_openai_format,
+    parse_tool_arguments,
     ModelInfo,
     ModelCapability,
 )
@@ -405,7 +405,7 @@ class OpenRouterBackend(BaseLLMBackend):
                     tool_calls.append({
                         "id": tc.id,
                         "name": tc.function.name,
-                        "arguments": json.loads(tc.function.arguments) if tc.function.arguments else {}
+                        "arguments": parse_tool_arguments(tc.function.arguments)
                     })
 
             logger.debug(
@@ -22,6 +22,8 @@ Environment Variables:
     ANTHROPIC_API_KEY   - For Anthropic/Claude
     OPENAI_API_KEY      - For OpenAI/GPT
     OPENROUTER_API_KEY  - For OpenRouter (access to 400+ models)
+    HARNESS_NO_HISTORY  - Set to disable interactive history load/save
+    NO_COLOR            - Set to disable colored output
 """
 
 import argparse
@@ -29,35 +31,40 @@ import sys
 import json
 import os
 import signal
-import readline
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from itertools import islice
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from harness import (
-    UniversalLLMHarness,
-    HarnessMode,
-    LLMBackend,
-    AgentState,
-    SandboxType,
-)
-from harness.evaluation import (
-    SelfEvaluationLoop,
-    FlywheelManager,
-    QAGenerationSystem,
-    create_evaluation_system,
-    create_qa_system
-)
-from harness.adapters import (
-    create_backend,
-    create_backend_from_env,
-    list_available_providers,
-    list_recommended_models,
-    MODEL_REGISTRY,
-)
+from harness._json import json_loads, json_dumps_bytes
+from harness.core.backend import LLMBackend
+
+# The harness, evaluation and adapter subsystems are imported inside the
+# commands that use them, so argument parsing and quick commands stay cheap.
+if TYPE_CHECKING:
+    from harness import UniversalLLMHarness, HarnessMode, AgentState
+    from harness.evaluation import (
+        SelfEvaluationLoop,
+        FlywheelManager,
+        QAGenerationSystem,
+    )
+
+
+# How long GET /status responses are reused in server mode, in seconds
+STATUS_CACHE_TTL = 1.0
+
+# Longest a GET /agents or /skills body is reused in server mode, in seconds.
+# The registry revision catches adds and removes; the TTL bounds staleness
+# from profiles and skills edited in place, which do not bump it.
+LISTING_CACHE_TTL = 5.0
+
+# Maximum number of entries shown by the /skills, /agents and /sandbox listings
+LIST_LIMIT = 20
 
 
 # ANSI color codes for terminal output
@@ -73,45 +80,100 @@ class Colors:
     DIM = '\033[2m'
 
 
+# Checked once at import; honours the NO_COLOR convention (https://no-color.org)
+_USE_COLOR = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+
 def colorize(text: str, color: str) -> str:
     """Add color to text if terminal supports it"""
-    if sys.stdout.isatty():
+    if _USE_COLOR:
         return f"{color}{text}{Colors.ENDC}"
     return text
 
 
-def print_banner():
-    """Print the harness banner"""
-    banner = """
+# Static output is colorized once at import rather than on every call
+_BANNER = colorize("""
 ╔═══════════════════════════════════════════════════════════════╗
 ║     Universal LLM Agent Harness                               ║
 ║     A game engine for AI agents                               ║
 ╚═══════════════════════════════════════════════════════════════╝
-"""
-    print(colorize(banner, Colors.CYAN))
+""", Colors.CYAN)
+
+_HELP_TEXT = colorize("""
+Available Commands:
+  /help      - Show this help
+  /status    - Show harness and agent status
+  /todos     - Show and manage todo list
+  /skills    - List available skills
+  /agents    - List all agents
+  /sandbox   - List sandboxes
+  /sandbox create [name] - Create a sandbox
+  /eval      - Show evaluation metrics
+  /export [file] - Export training data
+  /mode [mode] - Get/set harness mode
+  /compact   - Compact agent context
+  /msg <agent> <msg> - Send message to agent
+  /clear     - Clear screen
+  /quit      - Exit
+
+Text Commands (for non-tool LLMs):
+  You can also use text-based commands:
+  ```command:file.read
+  path: /path/to/file
+  ```
+
+  Or natural language:
+  "Read the file at /path/to/file"
+  "Run 'npm test' in the terminal"
+""", Colors.CYAN)
 
 
-def print_status(harness: UniversalLLMHarness):
+# Legacy Windows consoles without an ANSI layer still need `cls`
+_NEEDS_CLS = os.name == "nt" and not os.environ.get("ANSICON")
+
+
+def clear_screen():
+    """Clear the terminal without spawning a shell where ANSI is supported"""
+    if not sys.stdout.isatty():
+        return  # Piped or redirected: escapes would only be junk in the output
+    if _NEEDS_CLS:
+        os.system("cls")
+    else:
+        sys.stdout.write("\033[2J\033[H")
+        sys.stdout.flush()
+
+
+def print_banner():
+    """Print the harness banner"""
+    print(_BANNER)
+
+
+def print_status(harness: "UniversalLLMHarness"):
     """Print harness status"""
     status = harness.get_status()
-    print(colorize("\n📊 Harness Status:", Colors.BOLD))
-    print(f"  Agents:      {status['agents']}")
-    print(f"  Sandboxes:   {status['active_sandboxes']}")
-    print(f"  Skills:      {status['registered_skills']}")
-    print(f"  Marketplace: {status['marketplace_assets']} assets")
-    print(f"  Messages:    {status['message_bus'].get('pending_messages', 0)} pending")
+    print(
+        colorize("\n📊 Harness Status:", Colors.BOLD) + "\n"
+        f"  Agents:      {status['agents']}\n"
+        f"  Sandboxes:   {status['active_sandboxes']}\n"
+        f"  Skills:      {status['registered_skills']}\n"
+        f"  Marketplace: {status['marketplace_assets']} assets\n"
+        f"  Messages:    {status['message_bus'].get('pending_messages', 0)} pending"
+    )
 
 
-def print_agent_status(state: AgentState):
+def print_agent_status(state: "AgentState"):
     """Print agent status"""
-    print(colorize(f"\n🤖 Agent: {state.agent_id}", Colors.GREEN))
-    print(f"  Session:     {state.session_id}")
-    print(f"  Created:     {state.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"  Commands:    {state.commands_executed}")
-    print(f"  Skills used: {state.skills_invoked}")
-    print(f"  Messages:    {state.messages_sent}")
+    lines = [
+        colorize(f"\n🤖 Agent: {state.agent_id}", Colors.GREEN),
+        f"  Session:     {state.session_id}",
+        f"  Created:     {state.created_at:%Y-%m-%d %H:%M:%S}",
+        f"  Commands:    {state.commands_executed}",
+        f"  Skills used: {state.skills_invoked}",
+        f"  Messages:    {state.messages_sent}",
+    ]
     if state.todos:
-        print(f"  Todos:       {len(state.todos)}")
+        lines.append(f"  Todos:       {len(state.todos)}")
+    print("\n".join(lines))
 
 
 class CLILLMBackend(LLMBackend):
@@ -130,13 +192,16 @@ class CLILLMBackend(LLMBackend):
         tools: Optional[List[Dict[str, Any]]] = None,
         max_tokens: int = 4096
     ) -> Dict[str, Any]:
-        # Show context to user
-        print(colorize("\n--- LLM Context ---", Colors.DIM))
-        for msg in messages[-3:]:  # Show last 3 messages
-            role = msg.get("role", "unknown")
-            content = msg.get("content", "")[:200]
-            print(f"{role}: {content}...")
-        print(colorize("--- End Context ---\n", Colors.DIM))
+        # Show context to user (last 3 messages)
+        context = "\n".join(
+            f"{msg.get('role', 'unknown')}: {msg.get('content', '')[:200]}..."
+            for msg in messages[-3:]
+        )
+        print(
+            colorize("\n--- LLM Context ---", Colors.DIM) + "\n"
+            + context + "\n"
+            + colorize("--- End Context ---\n", Colors.DIM)
+        )
 
         # Prompt for response
         print(colorize("Enter agent response (end with blank line):", Colors.YELLOW))
@@ -177,6 +242,8 @@ def _create_real_backend(
 
     If no provider specified, auto-detects from environment variables.
     """
+    from harness.adapters import create_backend, create_backend_from_env
+
     if provider:
         return create_backend(provider, model=model, api_key=api_key)
     else:
@@ -185,6 +252,8 @@ def _create_real_backend(
 
 def print_providers():
     """Print available providers and their status."""
+    from harness.adapters import list_available_providers
+
     print(colorize("\n🔌 Available LLM Providers:", Colors.BOLD))
 
     availability = list_available_providers()
@@ -219,6 +288,8 @@ def print_providers():
 
 def print_models():
     """Print recommended models."""
+    from harness.adapters import MODEL_REGISTRY
+
     print(colorize("\n🤖 Recommended Models (December 2025):", Colors.BOLD))
 
     categories = [
@@ -242,6 +313,24 @@ def print_models():
                 print(f"    • {info.name:30} {info.context_window//1000}k ctx  {price}")
 
 
+def _time_suffix() -> str:
+    """HHMMSS timestamp used to name agents and sandboxes by default"""
+    return f"{datetime.now():%H%M%S}"
+
+
+def _split_word(text: str) -> Tuple[str, str]:
+    """Split off the first whitespace-delimited word: (word, rest)"""
+    parts = text.split(None, 1)
+    if not parts:
+        return "", ""
+    return parts[0], parts[1].rstrip() if len(parts) > 1 else ""
+
+
+def _first_word(text: str) -> Optional[str]:
+    """First whitespace-delimited word of text, or None if it is blank"""
+    return _split_word(text)[0] or None
+
+
 class HarnessCLI:
     """Main CLI handler"""
 
@@ -250,38 +339,71 @@ class HarnessCLI:
         self.base_path.mkdir(parents=True, exist_ok=True)
 
         self.config_path = self.base_path / "config.json"
-        self.config = self._load_config()
+        self._config_cache: Optional[Dict[str, Any]] = None
+        self._config_mtime: Optional[int] = None
 
-        self.harness: Optional[UniversalLLMHarness] = None
+        self.harness: Optional["UniversalLLMHarness"] = None
         self.current_agent_id: Optional[str] = None
 
         # Evaluation systems
-        self.eval_loop: Optional[SelfEvaluationLoop] = None
-        self.flywheel: Optional[FlywheelManager] = None
-        self.qa_system: Optional[QAGenerationSystem] = None
+        self.eval_loop: Optional["SelfEvaluationLoop"] = None
+        self.flywheel: Optional["FlywheelManager"] = None
+        self.qa_system: Optional["QAGenerationSystem"] = None
+
+        # Slash-command dispatch table for the interactive REPL
+        self._command_handlers = self._build_command_table()
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """CLI configuration, re-read only when config.json changes"""
+        return self._load_config()
+
+    @config.setter
+    def config(self, value: Dict[str, Any]):
+        # Pin the cache to the file as it is now so the assignment survives
+        # until it is saved, rather than being replaced by the on-disk copy
+        self._config_cache = value
+        self._config_mtime = self._config_file_mtime()
+
+    def _config_file_mtime(self) -> Optional[int]:
+        try:
+            return self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
 
     def _load_config(self) -> Dict[str, Any]:
         """Load CLI configuration"""
-        if self.config_path.exists():
-            with open(self.config_path) as f:
-                return json.load(f)
-        return {
-            "default_mode": "interactive",
-            "provider": None,  # Auto-detect from env
-            "model": None,     # Use provider default
-            "base_path": str(self.base_path),
-            "auto_evaluate": True,
-            "history_file": str(self.base_path / "history")
-        }
+        mtime = self._config_file_mtime()
+        if self._config_cache is not None and mtime == self._config_mtime:
+            return self._config_cache
+
+        if mtime is not None:
+            raw = self.config_path.read_bytes()
+            config = json_loads(raw)
+        else:
+            config = {
+                "default_mode": "interactive",
+                "provider": None,  # Auto-detect from env
+                "model": None,     # Use provider default
+                "base_path": str(self.base_path),
+                "auto_evaluate": True,
+                "history_file": str(self.base_path / "history")
+            }
+
+        self._config_cache = config
+        self._config_mtime = mtime
+        return config
 
     def _save_config(self):
         """Save CLI configuration"""
+        config = self.config
         with open(self.config_path, "w") as f:
-            json.dump(self.config, f, indent=2)
+            json.dump(config, f, indent=2)
+        self._config_mtime = self._config_file_mtime()
 
     def initialize(
         self,
-        mode: HarnessMode = HarnessMode.INTERACTIVE,
+        mode: Optional["HarnessMode"] = None,
         provider: Optional[str] = None,
         model: Optional[str] = None,
         human_mode: bool = False
@@ -290,11 +412,17 @@ class HarnessCLI:
         Initialize the harness with a real LLM backend.
 
         Args:
-            mode: Harness operation mode
+            mode: Harness operation mode (defaults to interactive)
             provider: LLM provider (anthropic, openai, openrouter, ollama)
             model: Model ID (provider-specific)
             human_mode: If True, use human-in-the-loop CLI backend
         """
+        from harness import UniversalLLMHarness, HarnessMode
+        from harness.evaluation import create_evaluation_system, create_qa_system
+
+        if mode is None:
+            mode = HarnessMode.INTERACTIVE
+
         print(colorize("Initializing harness...", Colors.DIM))
 
         # Create LLM backend
@@ -342,7 +470,7 @@ class HarnessCLI:
             self.initialize()
 
         session_id, state = self.harness.create_agent(
-            name=name or f"agent-{datetime.now().strftime('%H%M%S')}",
+            name=name or f"agent-{_time_suffix()}",
             capabilities=capabilities or ["general"]
         )
 
@@ -355,7 +483,8 @@ class HarnessCLI:
     def interactive_mode(self, agent_id: str = None):
         """Run interactive REPL"""
         if not self.harness:
-            self.initialize(HarnessMode.INTERACTIVE)
+            self.initialize()
+        self.harness.warmup()
 
         if not agent_id:
             agent_id = self.create_agent()
@@ -368,51 +497,83 @@ class HarnessCLI:
         print(colorize("\nCommands: /help, /status, /todos, /skills, /agents, /quit", Colors.DIM))
         print(colorize("Enter your task or message:\n", Colors.CYAN))
 
-        # Setup history
-        history_file = self.config.get("history_file")
+        # Setup line editing and history (only the REPL needs readline)
+        try:
+            import readline
+        except ImportError:
+            readline = None
+
+        history_file = None
+        if readline and not os.environ.get("HARNESS_NO_HISTORY"):
+            history_file = self.config.get("history_file")
         if history_file:
+            readline.set_history_length(5000)
             try:
                 readline.read_history_file(history_file)
-            except FileNotFoundError:
+            except OSError:
                 pass
 
-        while True:
-            try:
-                # Prompt
-                prompt = colorize(f"[{agent_id}] > ", Colors.GREEN)
-                user_input = input(prompt).strip()
+        # The agent is fixed for the session, so the prompt is built once
+        prompt = colorize(f"[{agent_id}] > ", Colors.GREEN)
 
-                if not user_input:
-                    continue
+        # Ctrl+C at the prompt just prints a hint and keeps reading; during a
+        # turn it still raises KeyboardInterrupt so a long LLM call can be cut off.
+        in_turn = False
 
-                # Handle commands
-                if user_input.startswith("/"):
-                    if self._handle_command(user_input):
-                        continue
-                    else:
-                        break
+        def on_sigint(signum, frame):
+            if in_turn:
+                raise KeyboardInterrupt
+            sys.stdout.write(colorize("\n\nInterrupted. Use /quit to exit.\n", Colors.YELLOW) + prompt)
+            sys.stdout.flush()
 
-                # Execute turn
-                print(colorize("\nProcessing...", Colors.DIM))
-                result = self.harness.execute_turn(agent_id, user_input)
+        previous_sigint = None
+        if threading.current_thread() is threading.main_thread():
+            previous_sigint = signal.signal(signal.SIGINT, on_sigint)
 
-                # Display response
-                print(colorize("\n📝 Response:", Colors.CYAN))
-                print(result.get("final_response", "[No response]"))
-
-                # Show command results if any
-                if result.get("results"):
-                    print(colorize("\n⚙️  Commands executed:", Colors.DIM))
-                    for r in result["results"][:5]:
-                        status = "✓" if r.get("success") else "✗"
-                        print(f"  {status} {r.get('command_id', 'unknown')}")
+        # Restored however the loop ends, including an error escaping a turn
+        try:
+            while True:
+                try:
+                    user_input = input(prompt).strip()
 
-                print()  # Blank line
+                    if not user_input:
+                        continue
 
-            except KeyboardInterrupt:
-                print(colorize("\n\nInterrupted. Use /quit to exit.", Colors.YELLOW))
-            except EOFError:
-                break
+                    # Handle commands
+                    if user_input.startswith("/"):
+                        if self._handle_command(user_input):
+                            continue
+                        else:
+                            break
+
+                    # Execute turn
+                    print(colorize("\nProcessing...", Colors.DIM))
+                    in_turn = True
+                    try:
+                        result = self.harness.execute_turn(agent_id, user_input)
+                    finally:
+                        in_turn = False
+
+                    # Display response
+                    print(colorize("\n📝 Response:", Colors.CYAN))
+                    print(result.get("final_response", "[No response]"))
+
+                    # Show command results if any
+                    if result.get("results"):
+                        print(colorize("\n⚙️  Commands executed:", Colors.DIM))
+                        for r in result["results"][:5]:
+                            status = "✓" if r.get("success") else "✗"
+                            print(f"  {status} {r.get('command_id', 'unknown')}")
+
+                    print()  # Blank line
+
+                except KeyboardInterrupt:
+                    print(colorize("\n\nTurn interrupted. Use /quit to exit.", Colors.YELLOW))
+                except EOFError:
+                    break
+        finally:
+            if previous_sigint is not None:
+                signal.signal(signal.SIGINT, previous_sigint)
 
         # Save history
         if history_file:
@@ -420,105 +581,73 @@ class HarnessCLI:
 
         print(colorize("\nGoodbye! 👋", Colors.CYAN))
 
+    def _build_command_table(self) -> Dict[str, Callable[[str], Any]]:
+        """Map slash commands to handlers taking the text after the command"""
+        return {
+            "/quit": lambda args: False,
+            "/exit": lambda args: False,
+            "/help": lambda args: self._show_help(),
+            "/status": self._cmd_status,
+            "/todos": lambda args: self._show_todos(),
+            "/skills": lambda args: self._list_skills(_first_word(args)),
+            "/agents": lambda args: self._list_agents(),
+            "/sandbox": self._cmd_sandbox,
+            "/eval": lambda args: self._show_evaluation(),
+            "/export": lambda args: self._export_data(_first_word(args) or "training_data.jsonl"),
+            "/clear": lambda args: clear_screen(),
+            "/mode": self._cmd_mode,
+            "/compact": self._cmd_compact,
+            "/msg": self._cmd_msg,
+        }
+
     def _handle_command(self, cmd: str) -> bool:
         """Handle CLI commands. Returns True to continue, False to exit."""
-        parts = cmd.split()
-        command = parts[0].lower()
-
-        if command == "/quit" or command == "/exit":
-            return False
-
-        elif command == "/help":
-            self._show_help()
-
-        elif command == "/status":
-            print_status(self.harness)
-            if self.current_agent_id:
-                state = self.harness.get_agent(self.current_agent_id)
-                if state:
-                    print_agent_status(state)
-
-        elif command == "/todos":
-            self._show_todos()
-
-        elif command == "/skills":
-            self._list_skills(parts[1] if len(parts) > 1 else None)
-
-        elif command == "/agents":
-            self._list_agents()
-
-        elif command == "/sandbox":
-            if len(parts) > 1 and parts[1] == "create":
-                name = parts[2] if len(parts) > 2 else None
-                self._create_sandbox(name)
-            else:
-                self._list_sandboxes()
-
-        elif command == "/eval":
-            self._show_evaluation()
-
-        elif command == "/export":
-            output = parts[1] if len(parts) > 1 else "training_data.jsonl"
-            self._export_data(output)
-
-        elif command == "/clear":
-            os.system('clear' if os.name == 'posix' else 'cls')
-
-        elif command == "/mode":
-            if len(parts) > 1:
-                self._set_mode(parts[1])
-            else:
-                print(f"Current mode: {self.harness.harness_mode.value}")
-
-        elif command == "/compact":
-            if self.current_agent_id:
-                result = self.harness.compact_context(self.current_agent_id)
-                print(colorize(f"✓ Context compacted (#{result.get('compaction_count', 0)})", Colors.GREEN))
-
-        elif command == "/msg":
-            if len(parts) >= 3:
-                to_agent = parts[1]
-                message = " ".join(parts[2:])
-                self._send_message(to_agent, message)
-            else:
-                print("Usage: /msg <agent_id> <message>")
+        command, args = _split_word(cmd)
+        command = command.lower()
 
-        else:
+        handler = self._command_handlers.get(command)
+        if handler is None:
             print(colorize(f"Unknown command: {command}", Colors.YELLOW))
             print("Use /help for available commands")
+            return True
 
-        return True
+        return handler(args) is not False
 
-    def _show_help(self):
-        """Show help text"""
-        help_text = """
-Available Commands:
-  /help      - Show this help
-  /status    - Show harness and agent status
-  /todos     - Show and manage todo list
-  /skills    - List available skills
-  /agents    - List all agents
-  /sandbox   - List sandboxes
-  /sandbox create [name] - Create a sandbox
-  /eval      - Show evaluation metrics
-  /export [file] - Export training data
-  /mode [mode] - Get/set harness mode
-  /compact   - Compact agent context
-  /msg <agent> <msg> - Send message to agent
-  /clear     - Clear screen
-  /quit      - Exit
+    def _cmd_status(self, args: str):
+        print_status(self.harness)
+        if self.current_agent_id:
+            state = self.harness.get_agent(self.current_agent_id)
+            if state:
+                print_agent_status(state)
 
-Text Commands (for non-tool LLMs):
-  You can also use text-based commands:
-  ```command:file.read
-  path: /path/to/file
-  ```
+    def _cmd_sandbox(self, args: str):
+        subcommand, rest = _split_word(args)
+        if subcommand == "create":
+            self._create_sandbox(_first_word(rest))
+        else:
+            self._list_sandboxes()
 
-  Or natural language:
-  "Read the file at /path/to/file"
-  "Run 'npm test' in the terminal"
-"""
-        print(colorize(help_text, Colors.CYAN))
+    def _cmd_mode(self, args: str):
+        if args:
+            self._set_mode(_first_word(args))
+        else:
+            print(f"Current mode: {self.harness.harness_mode.value}")
+
+    def _cmd_compact(self, args: str):
+        if self.current_agent_id:
+            result = self.harness.compact_context(self.current_agent_id)
+            print(colorize(f"✓ Context compacted (#{result.get('compaction_count', 0)})", Colors.GREEN))
+
+    def _cmd_msg(self, args: str):
+        to_agent, message = _split_word(args)
+        if to_agent and message:
+            self._send_message(to_agent, message)
+        else:
+            print("Usage: /msg <agent_id> <message>")
+
+    def _show_help(self):
+        """Show help text"""
+        print(_HELP_TEXT)
 
     def _show_todos(self):
         """Show agent todos"""
@@ -531,36 +660,40 @@ Text Commands (for non-tool LLMs):
             print("No todos")
             return
 
-        print(colorize("\n📋 Todo List:", Colors.BOLD))
+        lines = [colorize("\n📋 Todo List:", Colors.BOLD)]
         for i, todo in enumerate(state.todos, 1):
             status = todo.get("status", "pending")
             icon = "✓" if status == "completed" else "○" if status == "pending" else "◔"
             content = todo.get("content", "Unknown")
-            print(f"  {icon} {i}. {content}")
+            lines.append(f"  {icon} {i}. {content}")
+        print("\n".join(lines))
 
     def _list_skills(self, category: str = None):
         """List available skills"""
-        skills = self.harness.skill_registry.list_skills()
-
-        if category:
-            skills = [s for s in skills if s.category == category]
+        registry = self.harness.skill_registry
+        total = sum(1 for _ in registry.iter_skill_summaries(category=category))
 
-        print(colorize(f"\n🔧 Skills ({len(skills)}):", Colors.BOLD))
-        for skill in skills[:20]:
-            print(f"  • {skill.skill_id}: {skill.description[:50]}...")
-
-        if len(skills) > 20:
-            print(f"  ... and {len(skills) - 20} more")
+        lines = [colorize(f"\n🔧 Skills ({total}):", Colors.BOLD)]
+        lines.extend(
+            f"  • {skill_id}: {description[:50]}..."
+            for skill_id, description in registry.iter_skill_summaries(category=category, limit=LIST_LIMIT)
+        )
+        if total > LIST_LIMIT:
+            lines.append(f"  ... and {total - LIST_LIMIT} more")
+        print("\n".join(lines))
 
     def _list_agents(self):
         """List all agents"""
         agents = self.harness.agent_directory.list_all()
 
-        print(colorize(f"\n🤖 Agents ({len(agents)}):", Colors.BOLD))
-        for agent in agents:
+        lines = [colorize(f"\n🤖 Agents ({len(agents)}):", Colors.BOLD)]
+        for agent in agents[:LIST_LIMIT]:
             active = "●" if agent.status == "active" else "○"
             current = " (current)" if agent.agent_id == self.current_agent_id else ""
-            print(f"  {active} {agent.agent_id}: {agent.name}{current}")
+            lines.append(f"  {active} {agent.agent_id}: {agent.name}{current}")
+        if len(agents) > LIST_LIMIT:
+            lines.append(f"  ... and {len(agents) - LIST_LIMIT} more")
+        print("\n".join(lines))
 
     def _list_sandboxes(self):
         """List sandboxes"""
@@ -570,10 +703,13 @@ Text Commands (for non-tool LLMs):
 
         sandboxes = self.harness.sandbox_manager.get_agent_sandboxes(self.current_agent_id)
 
-        print(colorize(f"\n📦 Sandboxes ({len(sandboxes)}):", Colors.BOLD))
-        for sb in sandboxes:
-            print(f"  • {sb.sandbox_id}: {sb.name} ({sb.sandbox_type.value})")
-            print(f"    Path: {sb.root_path}")
+        lines = [colorize(f"\n📦 Sandboxes ({len(sandboxes)}):", Colors.BOLD)]
+        for sb in islice(sandboxes, LIST_LIMIT):
+            lines.append(f"  • {sb.sandbox_id}: {sb.name} ({sb.sandbox_type.value})")
+            lines.append(f"    Path: {sb.root_path}")
+        if len(sandboxes) > LIST_LIMIT:
+            lines.append(f"  ... and {len(sandboxes) - LIST_LIMIT} more")
+        print("\n".join(lines))
 
     def _create_sandbox(self, name: str = None):
         """Create a sandbox"""
@@ -583,7 +719,7 @@ Text Commands (for non-tool LLMs):
 
         sandbox = self.harness.sandbox_manager.create_sandbox(
             owner_id=self.current_agent_id,
-            name=name or f"sandbox-{datetime.now().strftime('%H%M%S')}"
+            name=name or f"sandbox-{_time_suffix()}"
         )
 
         if sandbox:
@@ -601,14 +737,16 @@ Text Commands (for non-tool LLMs):
         status = self.flywheel.get_flywheel_status()
         metrics = status["metrics"]
 
-        print(colorize("\n📊 Flywheel Status:", Colors.BOLD))
-        print(f"  Traces recorded:      {metrics['traces_recorded']}")
-        print(f"  Evaluations:          {metrics['evaluations_performed']}")
-        print(f"  Lessons extracted:    {metrics['lessons_extracted']}")
-        print(f"  Training data:        {metrics['training_data_generated']}")
-        print(f"  Average score:        {status['average_score']:.2f}")
-        print(f"  Trend:                {status['trend_direction']}")
-        print(f"  Health:               {status['health']}")
+        print(
+            colorize("\n📊 Flywheel Status:", Colors.BOLD) + "\n"
+            f"  Traces recorded:      {metrics['traces_recorded']}\n"
+            f"  Evaluations:          {metrics['evaluations_performed']}\n"
+            f"  Lessons extracted:    {metrics['lessons_extracted']}\n"
+            f"  Training data:        {metrics['training_data_generated']}\n"
+            f"  Average score:        {status['average_score']:.2f}\n"
+            f"  Trend:                {status['trend_direction']}\n"
+            f"  Health:               {status['health']}"
+        )
 
     def _export_data(self, output: str):
         """Export training data"""
@@ -626,40 +764,27 @@ Text Commands (for non-tool LLMs):
 
     def _set_mode(self, mode_str: str):
         """Set harness mode"""
-        mode_map = {
-            "interactive": HarnessMode.INTERACTIVE,
-            "autonomous": HarnessMode.AUTONOMOUS,
-            "collaborative": HarnessMode.COLLABORATIVE,
-            "supervised": HarnessMode.SUPERVISED
-        }
+        from harness import HarnessMode
 
-        mode = mode_map.get(mode_str.lower())
-        if mode:
-            self.harness.harness_mode = mode
-            print(colorize(f"✓ Mode set to: {mode.value}", Colors.GREEN))
-        else:
+        try:
+            mode = HarnessMode(mode_str.lower())
+        except ValueError:
             print(f"Unknown mode: {mode_str}")
-            print(f"Available: {', '.join(mode_map.keys())}")
+            print(f"Available: {', '.join(m.value for m in HarnessMode)}")
+            return
+
+        self.harness.harness_mode = mode
+        print(colorize(f"✓ Mode set to: {mode.value}", Colors.GREEN))
 
     def _send_message(self, to_agent: str, message: str):
         """Send message to another agent"""
-        from harness.communication import Message, MessageType
-        import uuid
-
-        msg = Message(
-            message_id=str(uuid.uuid4())[:12],
-            message_type=MessageType.DIRECT,
-            sender_id=self.current_agent_id,
-            recipient_id=to_agent,
-            content=message
-        )
-
-        self.harness.message_bus.send(msg)
+        self.harness.message_bus.send_direct(self.current_agent_id, to_agent, message)
         print(colorize(f"✓ Message sent to {to_agent}", Colors.GREEN))
 
     def run_task(self, task: str, agent_id: str = None, autonomous: bool = False):
         """Run a single task"""
         if not self.harness:
+            from harness import HarnessMode
             mode = HarnessMode.AUTONOMOUS if autonomous else HarnessMode.INTERACTIVE
             self.initialize(mode)
 
@@ -685,23 +810,60 @@ Text Commands (for non-tool LLMs):
     def server_mode(self, host: str = "127.0.0.1", port: int = 8080):
         """Run in server mode (HTTP API)"""
         try:
-            from http.server import HTTPServer, BaseHTTPRequestHandler
+            from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
         except ImportError:
             print("HTTP server not available")
             return
 
         if not self.harness:
+            from harness import HarnessMode
             self.initialize(HarnessMode.COLLABORATIVE)
+        self.harness.warmup()
 
         cli = self
 
+        # Dashboards poll /status; reuse a snapshot for a short window instead
+        # of rebuilding it for every request thread.
+        status_lock = threading.Lock()
+        status_cache = {"expires": 0.0, "value": None}
+
+        def cached_status() -> Dict[str, Any]:
+            with status_lock:
+                now = time.monotonic()
+                if now >= status_cache["expires"]:
+                    status_cache["value"] = cli.harness.get_status()
+                    status_cache["expires"] = now + STATUS_CACHE_TTL
+                return status_cache["value"]
+
+        # /agents and /skills bodies are encoded once per registry revision,
+        # and at most every LISTING_CACHE_TTL seconds
+        payload_lock = threading.Lock()
+        payload_cache: Dict[str, Any] = {}
+
+        def cached_payload(path: str, source, build) -> bytes:
+            with payload_lock:
+                now = time.monotonic()
+                revision, expires, body = payload_cache.get(path, (None, 0.0, None))
+                if revision != source.revision or now >= expires:
+                    revision = source.revision
+                    body = json_dumps_bytes(build())
+                    payload_cache[path] = (revision, now + LISTING_CACHE_TTL, body)
+                return body
+
         class HarnessHandler(BaseHTTPRequestHandler):
+            def _send_json(self, status: int, body: bytes):
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
             def do_POST(self):
                 content_length = int(self.headers['Content-Length'])
                 post_data = self.rfile.read(content_length)
 
                 try:
-                    data = json.loads(post_data)
+                    data = json_loads(post_data)
                     path = self.path
 
                     if path == "/agent/create":
@@ -726,40 +888,38 @@ Text Commands (for non-tool LLMs):
                     else:
                         response = {"error": "Unknown endpoint"}
 
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps(response).encode())
+                    self._send_json(200, json_dumps_bytes(response))
 
                 except Exception as e:
-                    self.send_response(500)
-                    self.send_header('Content-Type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps({"error": str(e)}).encode())
+                    self._send_json(500, json_dumps_bytes({"error": str(e)}))
 
             def do_GET(self):
                 path = self.path
 
                 if path == "/status":
-                    response = cli.harness.get_status()
+                    body = json_dumps_bytes(cached_status())
                 elif path == "/agents":
-                    agents = cli.harness.agent_directory.list_all()
-                    response = [a.to_dict() for a in agents]
+                    directory = cli.harness.agent_directory
+                    body = cached_payload(
+                        path, directory,
+                        lambda: [a.to_dict() for a in directory.list_all()]
+                    )
                 elif path == "/skills":
-                    skills = cli.harness.skill_registry.list_skills()
-                    response = [s.to_dict() for s in skills]
+                    registry = cli.harness.skill_registry
+                    body = cached_payload(
+                        path, registry,
+                        lambda: [s.to_dict() for s in registry.list_skills()]
+                    )
                 else:
-                    response = {"message": "Universal LLM Harness API"}
+                    body = json_dumps_bytes({"message": "Universal LLM Harness API"})
 
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps(response).encode())
+                self._send_json(200, body)
 
             def log_message(self, format, *args):
                 print(colorize(f"[API] {args[0]}", Colors.DIM))
 
-        server = HTTPServer((host, port), HarnessHandler)
+        # One thread per request so a long /task/run does not block polling
+        server = ThreadingHTTPServer((host, port), HarnessHandler)
         print(colorize(f"\n🌐 Server running at http://{host}:{port}", Colors.GREEN))
         print("Endpoints:")
         print("  GET  /status         - Harness status")
@@ -777,67 +937,37 @@ Text Commands (for non-tool LLMs):
             server.shutdown()
 
 
-def main():
-    """Main entry point"""
-    parser = argparse.ArgumentParser(
-        description="Universal LLM Agent Harness CLI - Now with REAL LLM backends!",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s interactive                        # Auto-detect backend from env
-  %(prog)s interactive --provider anthropic   # Use Anthropic Claude
-  %(prog)s interactive --provider openai --model gpt-4o
-  %(prog)s interactive --provider ollama --model llama3.3:70b
-  %(prog)s run "Analyze this code" --provider openrouter --model deepseek/deepseek-v3
-  %(prog)s providers                          # List available providers
-  %(prog)s models                             # List recommended models
+def _add_backend_args(p):
+    """Provider/model arguments shared across commands"""
+    p.add_argument("--provider", "-p",
+                   choices=["anthropic", "openai", "openrouter", "ollama"],
+                   help="LLM provider (auto-detected from env if not specified)")
+    p.add_argument("--model", "-M", help="Model ID (uses provider default if not specified)")
+    p.add_argument("--human", action="store_true",
+                   help="Use human-in-the-loop mode (no LLM)")
 
-Environment Variables:
-  ANTHROPIC_API_KEY   - For Anthropic/Claude models
-  OPENAI_API_KEY      - For OpenAI/GPT models
-  OPENROUTER_API_KEY  - For OpenRouter (400+ models)
-        """
-    )
 
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
+def _add_interactive_args(p):
+    p.add_argument("--agent", "-a", help="Agent ID to use")
+    p.add_argument("--mode", "-m", choices=["interactive", "autonomous", "supervised"],
+                   default="interactive", help="Harness mode")
+    _add_backend_args(p)
+
+
+def _add_run_args(p):
+    p.add_argument("task", help="Task to run")
+    p.add_argument("--agent", "-a", help="Agent ID to use")
+    p.add_argument("--autonomous", action="store_true", help="Run in autonomous mode")
+    _add_backend_args(p)
+
+
+def _add_server_args(p):
+    p.add_argument("--host", default="127.0.0.1", help="Host to bind")
+    p.add_argument("--port", "-p", type=int, default=8080, help="Port to bind")
 
-    # Provider/model arguments shared across commands
-    def add_backend_args(p):
-        p.add_argument("--provider", "-p",
-                       choices=["anthropic", "openai", "openrouter", "ollama"],
-                       help="LLM provider (auto-detected from env if not specified)")
-        p.add_argument("--model", "-M", help="Model ID (uses provider default if not specified)")
-        p.add_argument("--human", action="store_true",
-                       help="Use human-in-the-loop mode (no LLM)")
-
-    # Providers command
-    subparsers.add_parser("providers", help="List available LLM providers")
-
-    # Models command
-    subparsers.add_parser("models", help="List recommended models")
-
-    # Interactive mode
-    interactive_parser = subparsers.add_parser("interactive", help="Start interactive mode")
-    interactive_parser.add_argument("--agent", "-a", help="Agent ID to use")
-    interactive_parser.add_argument("--mode", "-m", choices=["interactive", "autonomous", "supervised"],
-                                    default="interactive", help="Harness mode")
-    add_backend_args(interactive_parser)
-
-    # Run task
-    run_parser = subparsers.add_parser("run", help="Run a single task")
-    run_parser.add_argument("task", help="Task to run")
-    run_parser.add_argument("--agent", "-a", help="Agent ID to use")
-    run_parser.add_argument("--autonomous", action="store_true", help="Run in autonomous mode")
-    add_backend_args(run_parser)
-
-    # Server mode
-    server_parser = subparsers.add_parser("server", help="Start API server")
-    server_parser.add_argument("--host", default="127.0.0.1", help="Host to bind")
-    server_parser.add_argument("--port", "-p", type=int, default=8080, help="Port to bind")
-
-    # Agent commands
-    agent_parser = subparsers.add_parser("agent", help="Agent management")
-    agent_sub = agent_parser.add_subparsers(dest="agent_command")
+
+def _add_agent_args(p):
+    agent_sub = p.add_subparsers(dest="agent_command")
 
     create_parser = agent_sub.add_parser("create", help="Create agent")
     create_parser.add_argument("--name", "-n", help="Agent name")
@@ -845,9 +975,9 @@ Environment Variables:
 
     agent_sub.add_parser("list", help="List agents")
 
-    # Skill commands
-    skill_parser = subparsers.add_parser("skill", help="Skill management")
-    skill_sub = skill_parser.add_subparsers(dest="skill_command")
+
+def _add_skill_args(p):
+    skill_sub = p.add_subparsers(dest="skill_command")
 
     list_skill_parser = skill_sub.add_parser("list", help="List skills")
     list_skill_parser.add_argument("--category", "-c", help="Filter by category")
@@ -855,9 +985,9 @@ Environment Variables:
     install_parser = skill_sub.add_parser("install", help="Install skill")
     install_parser.add_argument("skill_id", help="Skill ID to install")
 
-    # Sandbox commands
-    sandbox_parser = subparsers.add_parser("sandbox", help="Sandbox management")
-    sandbox_sub = sandbox_parser.add_subparsers(dest="sandbox_command")
+
+def _add_sandbox_args(p):
+    sandbox_sub = p.add_subparsers(dest="sandbox_command")
 
     sandbox_sub.add_parser("list", help="List sandboxes")
 
@@ -865,9 +995,9 @@ Environment Variables:
     create_sb_parser.add_argument("--name", "-n", help="Sandbox name")
     create_sb_parser.add_argument("--template", "-t", help="Template to use")
 
-    # Evaluation commands
-    eval_parser = subparsers.add_parser("eval", help="Evaluation and training")
-    eval_sub = eval_parser.add_subparsers(dest="eval_command")
+
+def _add_eval_args(p):
+    eval_sub = p.add_subparsers(dest="eval_command")
 
     eval_sub.add_parser("status", help="Show evaluation status")
 
@@ -877,8 +1007,66 @@ Environment Variables:
                                default="openai", help="Output format")
     export_parser.add_argument("--min-score", type=float, default=0.5, help="Minimum score threshold")
 
-    # Status
-    subparsers.add_parser("status", help="Show harness status")
+
+# Subcommands in help order: (name, help, argument builder). Builders only
+# run for the command actually being invoked, so `harness --help` and
+# argument-light commands skip constructing the rest of the tree.
+_SUBCOMMANDS = (
+    ("providers", "List available LLM providers", None),
+    ("models", "List recommended models", None),
+    ("interactive", "Start interactive mode", _add_interactive_args),
+    ("run", "Run a single task", _add_run_args),
+    ("server", "Start API server", _add_server_args),
+    ("agent", "Agent management", _add_agent_args),
+    ("skill", "Skill management", _add_skill_args),
+    ("sandbox", "Sandbox management", _add_sandbox_args),
+    ("eval", "Evaluation and training", _add_eval_args),
+    ("status", "Show harness status", None),
+)
+
+
+def build_parser(argv: Optional[List[str]] = None):
+    """Build the argument parser, populating only the selected subcommand.
+
+    Returns the parser and a mapping of subcommand name to its subparser.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else None
+
+    parser = argparse.ArgumentParser(
+        description="Universal LLM Agent Harness CLI - Now with REAL LLM backends!",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s interactive                        # Auto-detect backend from env
+  %(prog)s interactive --provider anthropic   # Use Anthropic Claude
+  %(prog)s interactive --provider openai --model gpt-4o
+  %(prog)s interactive --provider ollama --model llama3.3:70b
+  %(prog)s run "Analyze this code" --provider openrouter --model deepseek/deepseek-v3
+  %(prog)s providers                          # List available providers
+  %(prog)s models                             # List recommended models
+
+Environment Variables:
+  ANTHROPIC_API_KEY   - For Anthropic/Claude models
+  OPENAI_API_KEY      - For OpenAI/GPT models
+  OPENROUTER_API_KEY  - For OpenRouter (400+ models)
+        """
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+    command_parsers = {}
+    for name, help_text, add_args in _SUBCOMMANDS:
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if add_args and name == command:
+            add_args(command_parser)
+        command_parsers[name] = command_parser
+
+    return parser, command_parsers
+
+
+def main():
+    """Main entry point"""
+    parser, command_parsers = build_parser()
 
     # Parse arguments
     args = parser.parse_args()
@@ -894,6 +1082,7 @@ Environment Variables:
         print_models()
 
     elif args.command == "interactive":
+        from harness import HarnessMode
         mode = HarnessMode.AUTONOMOUS if args.mode == "autonomous" else HarnessMode.INTERACTIVE
         cli.initialize(
             mode,
@@ -904,6 +1093,7 @@ Environment Variables:
         cli.interactive_mode(args.agent)
 
     elif args.command == "run":
+        from harness import HarnessMode
         mode = HarnessMode.AUTONOMOUS if args.autonomous else HarnessMode.INTERACTIVE
         cli.initialize(
             mode,
@@ -923,7 +1113,7 @@ Environment Variables:
         elif args.agent_command == "list":
             cli._list_agents()
         else:
-            agent_parser.print_help()
+            command_parsers["agent"].print_help()
 
     elif args.command == "skill":
         cli.initialize(human_mode=True)
@@ -933,7 +1123,7 @@ Environment Variables:
             success, msg = cli.harness.marketplace.install(args.skill_id)
             print(colorize(f"{'✓' if success else '✗'} {msg}", Colors.GREEN if success else Colors.RED))
         else:
-            skill_parser.print_help()
+            command_parsers["skill"].print_help()
 
     elif args.command == "sandbox":
         cli.initialize(human_mode=True)
@@ -943,7 +1133,7 @@ Environment Variables:
         elif args.sandbox_command == "create":
             cli._create_sandbox(args.name)
         else:
-            sandbox_parser.print_help()
+            command_parsers["sandbox"].print_help()
 
     elif args.command == "eval":
         cli.initialize(human_mode=True)
@@ -957,7 +1147,7 @@ Environment Variables:
             )
             print(colorize(f"✓ Exported to {args.output}", Colors.GREEN))
         else:
-            eval_parser.print_help()
+            command_parsers["eval"].print_help()
 
     elif args.command == "status":
         cli.initialize(human_mode=True)
@@ -17,18 +17,27 @@ Design inspired by:
 - Message queue systems (RabbitMQ, Redis)
 """
 
+import re
 import json
 import uuid
 import time
 import threading
 import queue
+import heapq
 from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Callable, Set
-from datetime import datetime, timedelta
-from enum import Enum
+from datetime import datetime
+from enum import Enum, IntEnum
 from abc import ABC, abstractmethod
 import hashlib
 
+from .._compat import DATACLASS_SLOTS, NanosecondTimestamp, timestamp_ns_field
+
+
+def _datetime_to_ns(dt: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the epoch"""
+    return int(dt.timestamp()) * 1_000_000_000 + dt.microsecond * 1000
+
 
 class MessageType(Enum):
     """Types of inter-agent messages"""
@@ -59,8 +68,8 @@ class MessageType(Enum):
     ERROR = "error"
 
 
-class MessagePriority(Enum):
-    """Message priority levels"""
+class MessagePriority(IntEnum):
+    """Message priority levels (ints, so ordering and queue keys need no .value)"""
     LOW = 0
     NORMAL = 1
     HIGH = 2
@@ -68,8 +77,8 @@ class MessagePriority(Enum):
     CRITICAL = 4
 
 
-@dataclass
-class Message:
+@dataclass(**DATACLASS_SLOTS)
+class Message(NanosecondTimestamp):
     """
     Universal message format for inter-agent communication.
     Works with both tool-using and non-tool-using LLMs.
@@ -80,7 +89,7 @@ class Message:
     recipient_id: Optional[str]  # None for broadcast
     content: Any
     priority: MessagePriority = MessagePriority.NORMAL
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: int = timestamp_ns_field()
     ttl_seconds: int = 3600  # Time to live
     correlation_id: Optional[str] = None  # For request/response
     conversation_id: Optional[str] = None  # Thread tracking
@@ -91,7 +100,7 @@ class Message:
 
     def __post_init__(self):
         if not self.message_id:
-            self.message_id = str(uuid.uuid4())
+            self.message_id = uuid.uuid4().hex
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -101,7 +110,7 @@ class Message:
             "recipient_id": self.recipient_id,
             "content": self.content,
             "priority": self.priority.value,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_dt.isoformat(),
             "ttl_seconds": self.ttl_seconds,
             "correlation_id": self.correlation_id,
             "conversation_id": self.conversation_id,
@@ -118,7 +127,7 @@ class Message:
             f"[MESSAGE from {self.sender_id}]",
             f"ID: {self.message_id}",
             f"Type: {self.message_type.value}",
-            f"Time: {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Time: {self.timestamp_dt:%Y-%m-%d %H:%M:%S}",
         ]
 
         if self.topic:
@@ -140,13 +149,16 @@ class Message:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Message':
         return cls(
-            message_id=data.get("message_id", str(uuid.uuid4())),
+            message_id=data.get("message_id", uuid.uuid4().hex),
             message_type=MessageType(data["type"]),
             sender_id=data["sender_id"],
             recipient_id=data.get("recipient_id"),
             content=data["content"],
             priority=MessagePriority(data.get("priority", 1)),
-            timestamp=datetime.fromisoformat(data["timestamp"]) if "timestamp" in data else datetime.now(),
+            timestamp=(
+                _datetime_to_ns(datetime.fromisoformat(data["timestamp"]))
+                if "timestamp" in data else time.time_ns()
+            ),
             ttl_seconds=data.get("ttl_seconds", 3600),
             correlation_id=data.get("correlation_id"),
             conversation_id=data.get("conversation_id"),
@@ -155,8 +167,7 @@ class Message:
         )
 
     def is_expired(self) -> bool:
-        expiry = self.timestamp + timedelta(seconds=self.ttl_seconds)
-        return datetime.now() > expiry
+        return time.time_ns() > self.timestamp + self.ttl_seconds * 1_000_000_000
 
 
 @dataclass
@@ -207,8 +218,8 @@ class AgentMailbox:
 
         # Priority queue uses (priority, timestamp, message) tuple
         # Lower priority number = higher priority, so we negate
-        priority_key = -message.priority.value
-        self.inbox.put((priority_key, message.timestamp.timestamp(), message))
+        priority_key = -message.priority
+        self.inbox.put((priority_key, message.timestamp, message))
 
     def send(self, message: Message):
         """Queue message for sending"""
@@ -225,22 +236,11 @@ class AgentMailbox:
 
     def peek_messages(self, limit: int = 10) -> List[Message]:
         """Peek at messages without removing them"""
-        messages = []
-        temp = []
-
-        while len(messages) < limit:
-            try:
-                item = self.inbox.get_nowait()
-                temp.append(item)
-                messages.append(item[2])
-            except queue.Empty:
-                break
-
-        # Put them back
-        for item in temp:
-            self.inbox.put(item)
-
-        return messages
+        # Read the queue's heap in place: popping and re-pushing every item
+        # reallocated the entries and left the queue's task count inflated
+        with self.inbox.mutex:
+            items = heapq.nsmallest(limit, self.inbox.queue)
+        return [item[2] for item in items]
 
     def subscribe(self, topic: str):
         """Subscribe to a topic"""
@@ -262,9 +262,12 @@ class AgentMailbox:
         """Process pending messages using handlers"""
         responses = []
 
+        # Drain only what is already queued; blocking here cost every call
+        # a full timeout once the inbox ran dry
         for _ in range(max_messages):
-            message = self.get_next_message(timeout=0.1)
-            if not message:
+            try:
+                _, _, message = self.inbox.get_nowait()
+            except queue.Empty:
                 break
 
             for handler in self.handlers:
@@ -316,11 +319,11 @@ class MessageBus:
     def unregister_agent(self, agent_id: str):
         """Unregister an agent"""
         with self._lock:
-            if agent_id in self.mailboxes:
-                # Remove from all topic subscriptions
-                for subscribers in self.topic_subscribers.values():
-                    subscribers.discard(agent_id)
-                del self.mailboxes[agent_id]
+            self.mailboxes.pop(agent_id, None)
+            # Scan every topic: an agent can be subscribed without a mailbox,
+            # and a mailbox's own set is not kept in step with the bus table
+            for subscribers in self.topic_subscribers.values():
+                subscribers.discard(agent_id)
 
     def get_mailbox(self, agent_id: str) -> Optional[AgentMailbox]:
         """Get an agent's mailbox"""
@@ -418,6 +421,16 @@ class MessageBus:
             mailbox.unsubscribe(topic)
         return True
 
+    def send_direct(self, sender_id: str, recipient_id: str, content: Any) -> bool:
+        """Send a direct message to a single agent"""
+        return self.send(Message(
+            message_id=uuid.uuid4().hex,
+            message_type=MessageType.DIRECT,
+            sender_id=sender_id,
+            recipient_id=recipient_id,
+            content=content
+        ))
+
     def request(
         self,
         sender_id: str,
@@ -426,10 +439,10 @@ class MessageBus:
         timeout: float = 30
     ) -> Optional[Message]:
         """Send request and wait for response"""
-        correlation_id = str(uuid.uuid4())
+        correlation_id = uuid.uuid4().hex
 
         message = Message(
-            message_id=str(uuid.uuid4()),
+            message_id=uuid.uuid4().hex,
             message_type=MessageType.REQUEST,
             sender_id=sender_id,
             recipient_id=recipient_id,
@@ -453,7 +466,7 @@ class MessageBus:
     ) -> bool:
         """Send response to a request"""
         response = Message(
-            message_id=str(uuid.uuid4()),
+            message_id=uuid.uuid4().hex,
             message_type=MessageType.RESPONSE,
             sender_id=sender_id,
             recipient_id=original_message.sender_id,
@@ -471,7 +484,7 @@ class MessageBus:
     ) -> Conversation:
         """Start a new conversation thread"""
         conversation = Conversation(
-            conversation_id=str(uuid.uuid4()),
+            conversation_id=uuid.uuid4().hex,
             participants=set([initiator_id] + participant_ids),
             created_at=datetime.now(),
             last_activity=datetime.now(),
@@ -535,7 +548,7 @@ def create_task_message(
 ) -> Message:
     """Create a task assignment message"""
     return Message(
-        message_id=str(uuid.uuid4()),
+        message_id=uuid.uuid4().hex,
         message_type=MessageType.TASK_ASSIGN,
         sender_id=sender_id,
         recipient_id=recipient_id,
@@ -555,7 +568,7 @@ def create_broadcast_message(
 ) -> Message:
     """Create a broadcast message"""
     return Message(
-        message_id=str(uuid.uuid4()),
+        message_id=uuid.uuid4().hex,
         message_type=MessageType.BROADCAST,
         sender_id=sender_id,
         recipient_id=None,
@@ -571,7 +584,7 @@ def create_publish_message(
 ) -> Message:
     """Create a topic publish message"""
     return Message(
-        message_id=str(uuid.uuid4()),
+        message_id=uuid.uuid4().hex,
         message_type=MessageType.PUBLISH,
         sender_id=sender_id,
         recipient_id=None,
@@ -598,27 +611,38 @@ class TextMessageParser:
         'reply': r'^>>\s*(\S+)\s+(.+)$',  # >> message_id reply content
     }
 
+    # Compiled once with the class rather than looked up in re's cache on
+    # every parse
+    _COMPILED_PATTERNS = {name: re.compile(p) for name, p in PATTERNS.items()}
+
     def parse(self, text: str, sender_id: str) -> Optional[Message]:
         """Parse text into a Message"""
-        import re
-
         text = text.strip()
 
+        # Every format is keyed by its first character, so switch on it
+        # before trying any pattern.
+        lead = text[:1]
+
+        if lead == '#':
+            # Topic publish
+            match = self._COMPILED_PATTERNS['topic'].match(text)
+            if match:
+                return create_publish_message(sender_id, match.group(1), match.group(2))
+            return None
+
+        if lead != '@':
+            return None
+
         # Broadcast
-        match = re.match(self.PATTERNS['broadcast'], text)
+        match = self._COMPILED_PATTERNS['broadcast'].match(text)
         if match:
             return create_broadcast_message(sender_id, match.group(1))
 
-        # Topic publish
-        match = re.match(self.PATTERNS['topic'], text)
-        if match:
-            return create_publish_message(sender_id, match.group(1), match.group(2))
-
         # Direct message
-        match = re.match(self.PATTERNS['direct'], text)
+        match = self._COMPILED_PATTERNS['direct'].match(text)
         if match:
             return Message(
-                message_id=str(uuid.uuid4()),
+                message_id=uuid.uuid4().hex,
                 message_type=MessageType.DIRECT,
                 sender_id=sender_id,
                 recipient_id=match.group(1),
@@ -1,3 +1,49 @@
 """Core harness components"""
-from .command_protocol import *
-from .llm_harness import *
+import importlib
+import types
+
+# Names are resolved from their submodule on first access (PEP 562) so that
+# ``harness.core.command_protocol`` can be used without loading the full
+# orchestration layer in ``llm_harness``.
+_LAZY = types.MappingProxyType({
+    # Command protocol
+    "CommandType": ".command_protocol",
+    "Command": ".command_protocol",
+    "CommandResult": ".command_protocol",
+    "CommandParser": ".command_protocol",
+    "ToolCallParser": ".command_protocol",
+    "TextBlockParser": ".command_protocol",
+    "NaturalLanguageParser": ".command_protocol",
+    "UniversalCommandParser": ".command_protocol",
+    "COMMAND_TEMPLATES": ".command_protocol",
+    "generate_help_text": ".command_protocol",
+
+    # Backend interface
+    "LLMBackend": ".backend",
+
+    # Orchestration
+    "LLMType": ".llm_harness",
+    "HarnessMode": ".llm_harness",
+    "AgentState": ".llm_harness",
+    "ExecutionContext": ".llm_harness",
+    "MockLLMBackend": ".llm_harness",
+    "CommandExecutor": ".llm_harness",
+    "UniversalLLMHarness": ".llm_harness",
+    "create_harness": ".llm_harness",
+})
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name):
+    """Resolve names from the core submodules on demand."""
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
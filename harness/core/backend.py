@@ -0,0 +1,44 @@
+"""
+LLM Backend Interface
+The abstract interface every LLM provider implements.
+
+Kept in its own module so code that only needs to implement or type-check
+a backend does not have to import the full harness.
+"""
+
+from typing import Dict, Any, List, Optional
+from abc import ABC, abstractmethod
+
+
+class LLMBackend(ABC):
+    """
+    Abstract backend for LLM interactions.
+    Implement this for different LLM providers.
+    """
+
+    @abstractmethod
+    def generate(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        max_tokens: int = 4096
+    ) -> Dict[str, Any]:
+        """Generate a response from the LLM"""
+        pass
+
+    @abstractmethod
+    def count_tokens(self, text: str) -> int:
+        """Count tokens in text"""
+        pass
+
+    @property
+    @abstractmethod
+    def supports_tools(self) -> bool:
+        """Whether this backend supports native tool calling"""
+        pass
+
+    @property
+    @abstractmethod
+    def max_context_tokens(self) -> int:
+        """Maximum context window size"""
+        pass
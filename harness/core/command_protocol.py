@@ -10,14 +10,19 @@ Key insight: Commands can be expressed as:
 The protocol normalizes all three into a unified Command object.
 """
 
+import os
 import re
+import sys
+import copy
 import json
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Union, Callable
+from typing import Dict, Any, List, Optional, Tuple, Union, Callable
 from enum import Enum
 from abc import ABC, abstractmethod
-import hashlib
-from datetime import datetime
+from functools import lru_cache
+
+from .._compat import DATACLASS_SLOTS, NanosecondTimestamp, timestamp_ns_field
+from .._json import json_loads as _json_loads, json_dumps as _json_dumps
 
 
 class CommandType(Enum):
@@ -72,34 +77,49 @@ class CommandType(Enum):
     META_COMPACT = "meta.compact"
 
 
-@dataclass
-class Command:
+# Value -> member lookup for parsing untrusted type names without raising
+_COMMAND_TYPES = {cmd_type.value: cmd_type for cmd_type in CommandType}
+
+# Tool names the harness itself advertises ("file_read", "shell_exec", ...)
+_HARNESS_TOOL_NAMES = {
+    cmd_type.value.replace(".", "_"): cmd_type for cmd_type in CommandType
+}
+
+# Text-block literals converted to booleans (matched case-insensitively)
+_BOOL_LITERALS = {"true": True, "false": False}
+
+
+def _new_command_id() -> str:
+    """Random 12-hex-digit command ID, the same shape as uuid4().hex[:12]"""
+    # Random rather than a hash of the params: hashing meant serializing the
+    # whole payload (e.g. file.write content) for every command. Six random
+    # bytes skip building a UUID object, which dominated Command creation.
+    return os.urandom(6).hex()
+
+
+@dataclass(**DATACLASS_SLOTS)
+class Command(NanosecondTimestamp):
     """
     Universal command object.
     Can be constructed from tool calls, text blocks, or parsed natural language.
     """
     type: CommandType
     params: Dict[str, Any] = field(default_factory=dict)
-    command_id: str = ""
-    timestamp: datetime = field(default_factory=datetime.now)
+    command_id: str = field(default_factory=_new_command_id)
+    timestamp: int = timestamp_ns_field()
     source_format: str = "unknown"  # "tool", "text", "natural"
     raw_input: str = ""
 
-    def __post_init__(self):
-        if not self.command_id:
-            self.command_id = self._generate_id()
-
-    def _generate_id(self) -> str:
-        content = f"{self.type.value}-{self.timestamp.isoformat()}-{json.dumps(self.params, sort_keys=True)}"
-        return hashlib.sha256(content.encode()).hexdigest()[:12]
-
-    def to_json(self) -> str:
-        return json.dumps({
+    def to_dict(self) -> Dict[str, Any]:
+        return {
             "type": self.type.value,
             "params": self.params,
             "command_id": self.command_id,
-            "timestamp": self.timestamp.isoformat()
-        })
+            "timestamp": self.timestamp_dt.isoformat()
+        }
+
+    def to_json(self) -> str:
+        return _json_dumps(self.to_dict())
 
     def to_text_block(self) -> str:
         """Convert to text block format for non-tool LLMs"""
@@ -116,7 +136,7 @@ class Command:
         return '\n'.join(lines)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CommandResult:
     """Result of command execution"""
     command_id: str
@@ -124,17 +144,24 @@ class CommandResult:
     output: Any = None
     error: Optional[str] = None
     execution_time_ms: float = 0
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # None until set: the executor never attaches metadata, so a factory
+    # would allocate an empty dict for every result it builds
+    metadata: Optional[Dict[str, Any]] = None
 
-    def to_json(self) -> str:
-        return json.dumps({
+    def to_dict(self) -> Dict[str, Any]:
+        return {
             "command_id": self.command_id,
             "success": self.success,
             "output": self.output,
             "error": self.error,
             "execution_time_ms": self.execution_time_ms,
             "metadata": self.metadata
-        })
+        }
+
+    def to_json(self) -> str:
+        # The fields are to_dict's keys in order, so the dataclass is encoded
+        # directly without building the intermediate dict
+        return _json_dumps(self)
 
     def to_text_block(self) -> str:
         """Convert to text block format for readability"""
@@ -194,30 +221,62 @@ class ToolCallParser(CommandParser):
         # etc. - extensible
     }
 
+    # Cap on the exact-name table once inferred names are added to it
+    _MAX_ROUTES = 512
+
+    def __init__(self):
+        # Exact-name table built once: the harness's own tool names plus
+        # TOOL_TO_COMMAND (read from self so subclasses can extend it)
+        self._tool_to_command = {**_HARNESS_TOOL_NAMES, **self.TOOL_TO_COMMAND}
+        # Lowercased names for the substring fallback, computed once rather
+        # than per tool call for every table entry
+        self._lowered_tool_names = tuple(
+            (name.lower(), cmd_type) for name, cmd_type in self.TOOL_TO_COMMAND.items()
+        )
+
     def can_parse(self, input_data: Any) -> bool:
         if isinstance(input_data, dict):
             return "tool" in input_data or "function" in input_data or "name" in input_data
         return False
 
-    def parse(self, input_data: Dict[str, Any]) -> Optional[Command]:
+    @staticmethod
+    def _name_and_params(input_data: Dict[str, Any]) -> Tuple[Any, Any]:
+        """Extract the tool name and decoded arguments from a tool call."""
+        # Fast path: the adapters' generic format, arguments already decoded
+        params = input_data.get("arguments")
+        if type(params) is dict and params and "tool" not in input_data \
+                and "function" not in input_data:
+            return input_data.get("name"), params
+
         # Handle different tool call formats
         tool_name = input_data.get("tool") or input_data.get("function") or input_data.get("name")
-        params = input_data.get("arguments") or input_data.get("parameters") or input_data.get("input", {})
+        params = params or input_data.get("parameters") or input_data.get("input", {})
 
         if isinstance(params, str):
             try:
-                params = json.loads(params)
+                params = _json_loads(params)
             except:
                 params = {"raw": params}
+        return tool_name, params
+
+    def parse(self, input_data: Dict[str, Any]) -> Optional[Command]:
+        tool_name, params = self._name_and_params(input_data)
 
         # Map to command type
-        cmd_type = self.TOOL_TO_COMMAND.get(tool_name)
+        cmd_type = self._tool_to_command.get(tool_name)
         if not cmd_type:
             # Try to infer from name
-            for key, value in self.TOOL_TO_COMMAND.items():
-                if key.lower() in tool_name.lower():
+            lowered = tool_name.lower()
+            for name, value in self._lowered_tool_names:
+                if name in lowered:
                     cmd_type = value
                     break
+            # Remember the inferred route so the next call with this name is
+            # a single lookup; bounded since names come from LLM output.
+            # Interned so the key is the shared copy of the name rather than
+            # a slice of this one response's decoded JSON
+            if cmd_type and len(self._tool_to_command) < self._MAX_ROUTES:
+                self._tool_to_command[sys.intern(tool_name)] = cmd_type
 
         if not cmd_type:
             return None
@@ -225,11 +284,21 @@ class ToolCallParser(CommandParser):
         return Command(
             type=cmd_type,
             params=params,
-            source_format="tool",
-            raw_input=json.dumps(input_data)
+            # No raw_input: nothing reads it, and encoding it meant
+            # re-serializing every call's arguments (file contents and all)
+            source_format="tool"
         )
 
 
+def _copy_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy memoized params for a caller that may mutate them. JSON values
+    can nest lists and dicts, so those are copied all the way down."""
+    return {
+        key: copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+        for key, value in params.items()
+    }
+
+
 class TextBlockParser(CommandParser):
     """
     Parse text block commands (for non-tool-using LLMs).
@@ -251,88 +320,151 @@ class TextBlockParser(CommandParser):
     ```
     """
 
-    # Pattern to match command blocks
+    # Pattern to match command blocks. The type name stops at whitespace or
+    # a backtick and only spaces may precede the newline: with a plain \S+\s*
+    # each unterminated "```command:" in untrusted output could rescan the
+    # rest of the text, which is quadratic on Python's backtracking engine.
     BLOCK_PATTERN = re.compile(
-        r'```command:(\S+)\s*\n(.*?)```',
+        r'```command:([^\s`]+)[ \t\r]*\n(.*?)```',
         re.DOTALL
     )
 
+    # Literal every block starts with; a substring test rejects plain
+    # prose without running the regex engine over it
+    BLOCK_MARKER = '```command:'
+
+    # Replies longer than this are mostly file content and rarely repeat;
+    # they are parsed without going through the cache
+    CACHE_MAX_CHARS = 4096
+
+    def __init__(self):
+        # Agents resend the same short blocks (status, help, list) turn
+        # after turn, so block parses are memoized on the raw text
+        self._parse_blocks = lru_cache(maxsize=1024)(self._parse_blocks_uncached)
+
+    def clear_cache(self):
+        """Drop memoized block parses"""
+        self._parse_blocks.cache_clear()
+
     def can_parse(self, input_data: Any) -> bool:
-        if isinstance(input_data, str):
-            return bool(self.BLOCK_PATTERN.search(input_data))
-        return False
+        # Only the cheap marker test: parse() does the single regex pass and
+        # returns None when no block is valid, which makes
+        # UniversalCommandParser fall through to the next parser.
+        return isinstance(input_data, str) and self.BLOCK_MARKER in input_data
 
     def parse(self, input_data: str) -> Optional[List[Command]]:
         """Parse all command blocks from text"""
-        commands = []
-
-        for match in self.BLOCK_PATTERN.finditer(input_data):
-            cmd_type_str = match.group(1)
-            body = match.group(2).strip()
-
-            try:
-                cmd_type = CommandType(cmd_type_str)
-            except ValueError:
-                continue
+        if self.BLOCK_MARKER not in input_data:
+            return None
 
-            params = self._parse_params(body)
+        if len(input_data) <= self.CACHE_MAX_CHARS:
+            blocks = self._parse_blocks(input_data)
+        else:
+            blocks = self._parse_blocks_uncached(input_data)
+        if not blocks:
+            return None
 
-            commands.append(Command(
+        return [
+            Command(
                 type=cmd_type,
-                params=params,
+                params=_copy_params(params),
                 source_format="text",
-                raw_input=match.group(0)
-            ))
+                raw_input=raw
+            )
+            for cmd_type, params, raw in blocks
+        ]
+
+    def _parse_blocks_uncached(self, input_data: str) -> tuple:
+        """(type, params, raw text) for each valid block in the text"""
+        blocks = []
+
+        for match in self.BLOCK_PATTERN.finditer(input_data):
+            cmd_type = _COMMAND_TYPES.get(match.group(1))
+            if cmd_type is None:
+                continue
+
+            # The body goes to _parse_params as matched: it strips each line
+            # itself, so stripping the whole block first only copied it.
+            params = self._parse_params(match.group(2))
+            blocks.append((cmd_type, params, match.group(0)))
 
-        return commands if commands else None
+        return tuple(blocks)
 
     def _parse_params(self, body: str) -> Dict[str, Any]:
         """Parse parameter block"""
         params = {}
         lines = body.split('\n')
+
+        if '"""' not in body:
+            # Most blocks are flat "key: value" lines; with no delimiter
+            # there can be no multiline value, so skip the index bookkeeping
+            for line in lines:
+                line = line.strip()
+                if not line or line[0] == '#':
+                    continue
+                key, sep, value = line.partition(':')
+                if sep:
+                    params[sys.intern(key.strip())] = self._convert_value(value.strip())
+            return params
+
+        n = len(lines)
         i = 0
 
-        while i < len(lines):
+        while i < n:
             line = lines[i].strip()
 
-            if not line or line.startswith('#'):
+            if not line or line[0] == '#':
                 i += 1
                 continue
 
-            if ':' in line:
-                key, value = line.split(':', 1)
+            # One left-to-right scan finds the separator and splits on it
+            key, sep, value = line.partition(':')
+            if sep:
                 key = key.strip()
                 value = value.strip()
 
                 # Check for multiline value
-                if not value and i + 1 < len(lines) and lines[i + 1].strip() == '"""':
+                if not value and i + 1 < n and lines[i + 1].strip() == '"""':
                     # Multiline string
                     i += 2
                     multiline_parts = []
-                    while i < len(lines) and lines[i].strip() != '"""':
-                        multiline_parts.append(lines[i])
+                    while i < n:
+                        content_line = lines[i]
+                        # Substring test first so ordinary content lines are
+                        # not copied by strip() just to compare them
+                        if '"""' in content_line and content_line.strip() == '"""':
+                            break
+                        multiline_parts.append(content_line)
                         i += 1
                     value = '\n'.join(multiline_parts)
+                    if i >= n:
+                        # Unterminated: the value runs to the end of the
+                        # block, minus its trailing whitespace
+                        value = value.rstrip()
                 else:
-                    # Try to parse as JSON for complex types
-                    if value.startswith('{') or value.startswith('['):
-                        try:
-                            value = json.loads(value)
-                        except:
-                            pass
-                    elif value.lower() == 'true':
-                        value = True
-                    elif value.lower() == 'false':
-                        value = False
-                    elif value.isdigit():
-                        value = int(value)
-
-                params[key] = value
+                    value = self._convert_value(value)
+
+                # Keys come from a small fixed vocabulary (path, content,
+                # command...); interning keeps one copy across all blocks
+                params[sys.intern(key)] = value
 
             i += 1
 
         return params
 
+    @staticmethod
+    def _convert_value(value: str) -> Any:
+        """Convert a single-line value to JSON, int or bool where it looks like one"""
+        # Try to parse as JSON for complex types
+        if value[:1] in ('{', '['):
+            try:
+                return _json_loads(value)
+            except:
+                return value
+        if value.isdigit():
+            return int(value)
+        return _BOOL_LITERALS.get(value.lower(), value)
+
 
 class NaturalLanguageParser(CommandParser):
     """
@@ -400,6 +532,26 @@ class NaturalLanguageParser(CommandParser):
          CommandType.META_HELP, lambda m: {"topic": m.group(1) if m.group(1) else None}),
     ]
 
+    # Longer replies are prose or file content that rarely repeats; they are
+    # matched without going through the cache so it never pins them
+    CACHE_MAX_CHARS = 4096
+
+    def __init__(self):
+        # Compile once per parser instead of going through re's pattern
+        # cache on every parse() call; reading self.PATTERNS lets
+        # subclasses extend the table.
+        self._compiled_patterns = [
+            (re.compile(pattern, re.IGNORECASE), cmd_type, param_extractor)
+            for pattern, cmd_type, param_extractor in self.PATTERNS
+        ]
+        # Agent loops keep sending the same short phrases ("status", "help"),
+        # so pattern matches are memoized on the normalized text
+        self._match = lru_cache(maxsize=2048)(self._match_uncached)
+
+    def clear_cache(self):
+        """Drop memoized pattern matches"""
+        self._match.cache_clear()
+
     def can_parse(self, input_data: Any) -> bool:
         if isinstance(input_data, str):
             # Check if it's not already a command block
@@ -408,21 +560,29 @@ class NaturalLanguageParser(CommandParser):
             return True
         return False
 
+    def _match_uncached(self, text: str) -> Optional[tuple]:
+        for pattern, cmd_type, param_extractor in self._compiled_patterns:
+            match = pattern.search(text)
+            if match:
+                return cmd_type, param_extractor(match)
+        return None
+
     def parse(self, input_data: str) -> Optional[Command]:
         text = input_data.strip().lower()
+        if len(text) <= self.CACHE_MAX_CHARS:
+            matched = self._match(text)
+        else:
+            matched = self._match_uncached(text)
+        if matched is None:
+            return None
 
-        for pattern, cmd_type, param_extractor in self.PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                params = param_extractor(match)
-                return Command(
-                    type=cmd_type,
-                    params=params,
-                    source_format="natural",
-                    raw_input=input_data
-                )
-
-        return None
+        cmd_type, params = matched
+        return Command(
+            type=cmd_type,
+            params=dict(params),  # Callers may mutate; keep the cached copy intact
+            source_format="natural",
+            raw_input=input_data
+        )
 
 
 class UniversalCommandParser:
@@ -432,18 +592,37 @@ class UniversalCommandParser:
     """
 
     def __init__(self):
-        self.parsers: List[CommandParser] = [
+        self._builtin_parsers = (
             ToolCallParser(),
             TextBlockParser(),
             NaturalLanguageParser(),
-        ]
+        )
+        self.parsers: List[CommandParser] = list(self._builtin_parsers)
 
     def parse(self, input_data: Any) -> List[Command]:
         """
         Parse input and return list of commands.
         Tries each parser in order until one succeeds.
         """
-        for parser in self.parsers:
+        parsers = self.parsers
+        if len(parsers) == 3:
+            tool_parser, text_parser, natural_parser = self._builtin_parsers
+            if parsers[0] is tool_parser and parsers[1] is text_parser \
+                    and parsers[2] is natural_parser:
+                # Fast path for the built-in chain: the input's type (and the
+                # block marker for text) picks the one parser whose
+                # can_parse would accept it, without walking the chain
+                if isinstance(input_data, str):
+                    if text_parser.BLOCK_MARKER in input_data:
+                        return text_parser.parse(input_data) or []
+                    result = natural_parser.parse(input_data)
+                    return [result] if result else []
+                if tool_parser.can_parse(input_data):
+                    result = tool_parser.parse(input_data)
+                    return [result] if result else []
+                return []
+
+        for parser in parsers:
             if parser.can_parse(input_data):
                 result = parser.parse(input_data)
                 if result:
@@ -502,8 +681,14 @@ resources: {"cpu": 1, "memory": "512MB"}
 }
 
 
+@lru_cache(maxsize=None)
 def generate_help_text() -> str:
-    """Generate help text showing all available commands"""
+    """Generate help text showing all available commands.
+
+    The result depends only on CommandType and COMMAND_TEMPLATES, so it is
+    built once; call ``generate_help_text.cache_clear()`` after changing
+    the templates.
+    """
     help_lines = [
         "# Universal Command Reference",
         "",
@@ -17,17 +17,20 @@ This harness is designed to be at least as capable as:
 """
 
 import json
+import re
 import time
 import uuid
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Callable, Union, Tuple
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from abc import ABC, abstractmethod
 
 # Import harness components
+from .._compat import DATACLASS_SLOTS
+from .backend import LLMBackend
 from .command_protocol import (
     Command, CommandResult, CommandType,
     UniversalCommandParser, generate_help_text
@@ -47,6 +50,156 @@ from ..communication.message_bus import (
 )
 
 
+# Phrases an agent uses to signal it is done, matched in one case-insensitive
+# scan of the response
+_TASK_COMPLETE_PATTERN = re.compile(
+    "|".join(re.escape(indicator) for indicator in (
+        "task complete",
+        "all done",
+        "finished",
+        "[DONE]",
+        "completed successfully",
+    )),
+    re.IGNORECASE
+)
+
+
+# Tool definitions offered to tool-using LLMs, built once at import. A tuple
+# so the shared catalog itself cannot be appended to by a caller; the
+# required lists are tuples too. The dicts stay plain dicts because provider
+# SDKs JSON-encode them, and neither json nor orjson accepts a mappingproxy.
+_TOOL_DEFINITIONS = (
+    {
+        "name": "file_read",
+        "description": "Read contents of a file",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "Path to file"}
+            },
+            "required": ("path",)
+        }
+    },
+    {
+        "name": "file_write",
+        "description": "Write contents to a file",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "path": {"type": "string"},
+                "content": {"type": "string"}
+            },
+            "required": ("path", "content")
+        }
+    },
+    {
+        "name": "shell_exec",
+        "description": "Execute a shell command",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "command": {"type": "string"}
+            },
+            "required": ("command",)
+        }
+    },
+    {
+        "name": "skill_invoke",
+        "description": "Invoke a skill by ID",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "skill": {"type": "string"},
+                "params": {"type": "object"}
+            },
+            "required": ("skill",)
+        }
+    },
+    {
+        "name": "msg_send",
+        "description": "Send a message to another agent",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "to": {"type": "string"},
+                "message": {"type": "string"}
+            },
+            "required": ("to", "message")
+        }
+    }
+)
+
+
+# Required parameters per command type, taken from the tool definitions and
+# checked before dispatch so a missing argument is reported by name
+_REQUIRED_PARAMS: Dict[CommandType, frozenset] = {
+    CommandType(tool["name"].replace("_", ".", 1)): frozenset(tool["parameters"]["required"])
+    for tool in _TOOL_DEFINITIONS
+}
+
+# Read-only commands whose handlers share no mutable state; a batch made up
+# only of these runs concurrently, anything else keeps the reply's order
+_CONCURRENT_COMMANDS = frozenset({
+    CommandType.FILE_READ,
+    CommandType.FILE_LIST,
+    CommandType.FILE_SEARCH,
+})
+
+# Bound once: _execute_single reads the clock twice per command, and a module
+# global is one lookup where time.perf_counter_ns is two
+_perf_counter_ns = time.perf_counter_ns
+
+# Static system prompt layers, built once instead of on every turn
+_IDENTITY_LAYER = """# Agent Identity
+You are an AI agent operating within the Universal LLM Harness.
+You have access to a set of commands and skills to accomplish tasks.
+
+# Core Rules
+1. Always break complex tasks into smaller steps
+2. Use the todo list to track progress and maintain focus
+3. Execute commands to interact with the environment
+4. Communicate with other agents when collaboration is needed
+5. Create snapshots before making significant changes
+6. Report errors and blockers clearly
+"""
+
+_COMMAND_FORMAT_LAYER = """
+# Command Format
+You can issue commands in these formats:
+
+1. Text blocks (for any LLM):
+```command:command.type
+param1: value1
+param2: value2
+```
+
+2. Natural language (will be parsed):
+"Read the file at /path/to/file"
+"Run 'npm test' in the terminal"
+"Send a message to agent-123"
+
+# Available Command Types
+- file.read, file.write, file.edit, file.list, file.search
+- shell.exec, shell.background
+- msg.send, msg.broadcast, msg.subscribe
+- sandbox.create, sandbox.share, sandbox.snapshot
+- skill.invoke, skill.list
+- agent.spawn, agent.query
+- market.search, market.install
+- state.get, state.set
+- meta.help, meta.status
+"""
+
+
+def _capabilities_layer(skills: List[SkillMetadata]) -> str:
+    """System prompt layer listing skills (first 20) and the command format"""
+    skills_summary = "\n".join([
+        f"- {s.skill_id}: {s.description}"
+        for s in skills[:20]
+    ])
+    return f"# Available Skills\n{skills_summary}\n{_COMMAND_FORMAT_LAYER}"
+
+
 class LLMType(Enum):
     """Classification of LLM capabilities"""
     TOOL_NATIVE = "tool_native"      # Native function/tool calling (Claude, GPT-4)
@@ -114,7 +267,7 @@ class AgentState:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExecutionContext:
     """
     Context provided to the LLM for each execution turn.
@@ -146,40 +299,6 @@ class ExecutionContext:
     harness_mode: HarnessMode
 
 
-class LLMBackend(ABC):
-    """
-    Abstract backend for LLM interactions.
-    Implement this for different LLM providers.
-    """
-
-    @abstractmethod
-    def generate(
-        self,
-        messages: List[Dict[str, Any]],
-        tools: Optional[List[Dict[str, Any]]] = None,
-        max_tokens: int = 4096
-    ) -> Dict[str, Any]:
-        """Generate a response from the LLM"""
-        pass
-
-    @abstractmethod
-    def count_tokens(self, text: str) -> int:
-        """Count tokens in text"""
-        pass
-
-    @property
-    @abstractmethod
-    def supports_tools(self) -> bool:
-        """Whether this backend supports native tool calling"""
-        pass
-
-    @property
-    @abstractmethod
-    def max_context_tokens(self) -> int:
-        """Maximum context window size"""
-        pass
-
-
 class MockLLMBackend(LLMBackend):
     """
     Mock backend for testing ONLY.
@@ -253,6 +372,41 @@ class CommandExecutor:
         self.agent_directory = agent_directory
         self.marketplace = marketplace
         self.parser = UniversalCommandParser()
+        # Built once: bound methods are resolved here rather than in a dict
+        # literal rebuilt for every executed command
+        handlers: Dict[CommandType, Callable[[Dict, str, str], Any]] = {
+            CommandType.FILE_READ: self._handle_file_read,
+            CommandType.FILE_WRITE: self._handle_file_write,
+            CommandType.FILE_EDIT: self._handle_file_edit,
+            CommandType.FILE_LIST: self._handle_file_list,
+            CommandType.FILE_SEARCH: self._handle_file_search,
+            CommandType.SHELL_EXEC: self._handle_shell_exec,
+            CommandType.MSG_SEND: self._handle_msg_send,
+            CommandType.MSG_BROADCAST: self._handle_msg_broadcast,
+            CommandType.MSG_SUBSCRIBE: self._handle_msg_subscribe,
+            CommandType.SANDBOX_CREATE: self._handle_sandbox_create,
+            CommandType.SANDBOX_SHARE: self._handle_sandbox_share,
+            CommandType.SANDBOX_SNAPSHOT: self._handle_sandbox_snapshot,
+            CommandType.SKILL_INVOKE: self._handle_skill_invoke,
+            CommandType.SKILL_LIST: self._handle_skill_list,
+            CommandType.AGENT_SPAWN: self._handle_agent_spawn,
+            CommandType.AGENT_QUERY: self._handle_agent_query,
+            CommandType.MARKET_SEARCH: self._handle_market_search,
+            CommandType.MARKET_INSTALL: self._handle_market_install,
+            CommandType.STATE_GET: self._handle_state_get,
+            CommandType.STATE_SET: self._handle_state_set,
+            CommandType.META_HELP: self._handle_help,
+            CommandType.META_STATUS: self._handle_status,
+        }
+        # Each entry pairs the handler with its required params, so routing a
+        # command is a single lookup; types with no requirements get an empty
+        # set, which every params dict satisfies
+        self._dispatch: Dict[CommandType, Tuple[Callable[[Dict, str, str], Any], frozenset]] = {
+            command_type: (handler, _REQUIRED_PARAMS.get(command_type, frozenset()))
+            for command_type, handler in handlers.items()
+        }
+        # Created on the first batch of reads that can run concurrently
+        self._read_pool: Optional[ThreadPoolExecutor] = None
 
     def execute(
         self,
@@ -262,8 +416,20 @@ class CommandExecutor:
     ) -> List[CommandResult]:
         """Execute commands from parsed input"""
         commands = self.parser.parse(input_data)
-        results = []
 
+        if len(commands) > 1 and all(c.type in _CONCURRENT_COMMANDS for c in commands):
+            # Independent reads overlap their file and subprocess I/O;
+            # map() keeps the results in command order
+            if self._read_pool is None:
+                self._read_pool = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="harness-read"
+                )
+            return list(self._read_pool.map(
+                lambda command: self._execute_single(command, agent_id, sandbox_id),
+                commands
+            ))
+
+        results = []
         for command in commands:
             result = self._execute_single(command, agent_id, sandbox_id)
             results.append(result)
@@ -277,60 +443,36 @@ class CommandExecutor:
         sandbox_id: str = None
     ) -> CommandResult:
         """Execute a single command"""
-        start_time = time.time()
-
-        try:
-            # Route to appropriate handler
-            handlers = {
-                CommandType.FILE_READ: self._handle_file_read,
-                CommandType.FILE_WRITE: self._handle_file_write,
-                CommandType.FILE_EDIT: self._handle_file_edit,
-                CommandType.FILE_LIST: self._handle_file_list,
-                CommandType.FILE_SEARCH: self._handle_file_search,
-                CommandType.SHELL_EXEC: self._handle_shell_exec,
-                CommandType.MSG_SEND: self._handle_msg_send,
-                CommandType.MSG_BROADCAST: self._handle_msg_broadcast,
-                CommandType.MSG_SUBSCRIBE: self._handle_msg_subscribe,
-                CommandType.SANDBOX_CREATE: self._handle_sandbox_create,
-                CommandType.SANDBOX_SHARE: self._handle_sandbox_share,
-                CommandType.SANDBOX_SNAPSHOT: self._handle_sandbox_snapshot,
-                CommandType.SKILL_INVOKE: self._handle_skill_invoke,
-                CommandType.SKILL_LIST: self._handle_skill_list,
-                CommandType.AGENT_SPAWN: self._handle_agent_spawn,
-                CommandType.AGENT_QUERY: self._handle_agent_query,
-                CommandType.MARKET_SEARCH: self._handle_market_search,
-                CommandType.MARKET_INSTALL: self._handle_market_install,
-                CommandType.STATE_GET: self._handle_state_get,
-                CommandType.STATE_SET: self._handle_state_set,
-                CommandType.META_HELP: self._handle_help,
-                CommandType.META_STATUS: self._handle_status,
-            }
-
-            handler = handlers.get(command.type)
-            if not handler:
-                return CommandResult(
-                    command_id=command.command_id,
-                    success=False,
-                    error=f"No handler for command type: {command.type.value}",
-                    execution_time_ms=(time.time() - start_time) * 1000
-                )
+        start_ns = _perf_counter_ns()
 
-            output = handler(command.params, agent_id, sandbox_id)
-
-            return CommandResult(
-                command_id=command.command_id,
-                success=True,
-                output=output,
-                execution_time_ms=(time.time() - start_time) * 1000
-            )
-
-        except Exception as e:
-            return CommandResult(
-                command_id=command.command_id,
-                success=False,
-                error=str(e),
-                execution_time_ms=(time.time() - start_time) * 1000
-            )
+        # Route to appropriate handler; every failure falls through to the
+        # one error result at the end
+        entry = self._dispatch.get(command.type)
+        if entry is None:
+            error = f"No handler for command type: {command.type.value}"
+        else:
+            handler, required = entry
+            params = command.params
+            try:
+                if required.issubset(params):
+                    output = handler(params, agent_id, sandbox_id)
+                    return CommandResult(
+                        command_id=command.command_id,
+                        success=True,
+                        output=output,
+                        execution_time_ms=(_perf_counter_ns() - start_ns) / 1e6
+                    )
+                missing = ", ".join(sorted(required.difference(params)))
+                error = f"Missing required parameter(s) for {command.type.value}: {missing}"
+            except Exception as e:
+                error = str(e)
+
+        return CommandResult(
+            command_id=command.command_id,
+            success=False,
+            error=error,
+            execution_time_ms=(_perf_counter_ns() - start_ns) / 1e6
+        )
 
     # Command handlers
     def _handle_file_read(self, params: Dict, agent_id: str, sandbox_id: str) -> Any:
@@ -420,7 +562,7 @@ class CommandExecutor:
         content = params.get("message")
 
         message = Message(
-            message_id=str(uuid.uuid4()),
+            message_id=uuid.uuid4().hex,
             message_type=MsgType.DIRECT,
             sender_id=agent_id,
             recipient_id=to,
@@ -433,7 +575,7 @@ class CommandExecutor:
         content = params.get("message")
 
         message = Message(
-            message_id=str(uuid.uuid4()),
+            message_id=uuid.uuid4().hex,
             message_type=MsgType.BROADCAST,
             sender_id=agent_id,
             recipient_id=None,
@@ -531,10 +673,8 @@ class CommandExecutor:
 
     def _handle_help(self, params: Dict, agent_id: str, sandbox_id: str) -> Any:
         topic = params.get("topic")
-        if topic:
-            skill = self.skill_registry.get_skill(topic)
-            if skill:
-                return skill.get_help()
+        if topic and self.skill_registry.get_skill(topic):
+            return self.skill_registry.get_skill_prompt(topic)
         return generate_help_text()
 
     def _handle_status(self, params: Dict, agent_id: str, sandbox_id: str) -> Any:
@@ -594,6 +734,10 @@ class UniversalLLMHarness:
         self.agents: Dict[str, AgentState] = {}
         self.sessions: Dict[str, str] = {}  # session_id -> agent_id
 
+        # (registry revision, skill list, capabilities prompt layer), rebuilt
+        # only when a skill is registered or removed
+        self._skills_snapshot: Optional[Tuple[int, List[SkillMetadata], str]] = None
+
         self._lock = threading.Lock()
 
     def create_agent(
@@ -604,8 +748,8 @@ class UniversalLLMHarness:
         specializations: List[str] = None
     ) -> Tuple[str, AgentState]:
         """Create a new agent in the harness"""
-        agent_id = agent_id or str(uuid.uuid4())[:8]
-        session_id = str(uuid.uuid4())[:12]
+        agent_id = agent_id or uuid.uuid4().hex[:8]
+        session_id = uuid.uuid4().hex[:12]
 
         # Create agent state
         state = AgentState(
@@ -675,7 +819,7 @@ class UniversalLLMHarness:
         mailbox = self.message_bus.get_mailbox(agent_id)
         pending_messages = mailbox.peek_messages(5) if mailbox else []
 
-        available_skills = self.skill_registry.list_skills()
+        available_skills = list(self._get_skills_snapshot()[1])
         available_agents = self.agent_directory.list_all(status="active")
 
         return ExecutionContext(
@@ -694,6 +838,31 @@ class UniversalLLMHarness:
             harness_mode=self.harness_mode
         )
 
+    def warmup(self):
+        """
+        Fill the caches the first turn would otherwise pay for: the skills
+        snapshot and capabilities layer, the help texts, and one parse of
+        each command format. Nothing is executed.
+        """
+        self._get_skills_snapshot()
+        self.skill_registry.get_all_skills_prompt()
+        generate_help_text()
+
+        parser = self.executor.parser
+        parser.parse({"name": "meta_help", "arguments": {}})
+        parser.parse("```command:meta.help\n```")
+        parser.parse("help")
+
+    def _get_skills_snapshot(self) -> Tuple[int, List[SkillMetadata], str]:
+        """Registered skills and their prompt layer, as of the registry's revision"""
+        snapshot = self._skills_snapshot
+        revision = self.skill_registry.revision
+        if snapshot is None or snapshot[0] != revision:
+            skills = self.skill_registry.list_skills()
+            snapshot = (revision, skills, _capabilities_layer(skills))
+            self._skills_snapshot = snapshot
+        return snapshot
+
     def build_system_prompt(self, context: ExecutionContext) -> str:
         """
         Build the system prompt that defines agent behavior.
@@ -702,53 +871,14 @@ class UniversalLLMHarness:
         layers = []
 
         # Layer 1: Core identity and rules
-        layers.append("""# Agent Identity
-You are an AI agent operating within the Universal LLM Harness.
-You have access to a set of commands and skills to accomplish tasks.
+        layers.append(_IDENTITY_LAYER)
 
-# Core Rules
-1. Always break complex tasks into smaller steps
-2. Use the todo list to track progress and maintain focus
-3. Execute commands to interact with the environment
-4. Communicate with other agents when collaboration is needed
-5. Create snapshots before making significant changes
-6. Report errors and blockers clearly
-""")
-
-        # Layer 2: Available capabilities
-        skills_summary = "\n".join([
-            f"- {s.skill_id}: {s.description}"
-            for s in context.available_skills[:20]
-        ])
-
-        layers.append(f"""# Available Skills
-{skills_summary}
-
-# Command Format
-You can issue commands in these formats:
-
-1. Text blocks (for any LLM):
-```command:command.type
-param1: value1
-param2: value2
-```
-
-2. Natural language (will be parsed):
-"Read the file at /path/to/file"
-"Run 'npm test' in the terminal"
-"Send a message to agent-123"
-
-# Available Command Types
-- file.read, file.write, file.edit, file.list, file.search
-- shell.exec, shell.background
-- msg.send, msg.broadcast, msg.subscribe
-- sandbox.create, sandbox.share, sandbox.snapshot
-- skill.invoke, skill.list
-- agent.spawn, agent.query
-- market.search, market.install
-- state.get, state.set
-- meta.help, meta.status
-""")
+        # Layer 2: Available capabilities, reused while the context carries
+        # the registry's current skills
+        _, skills, capabilities_layer = self._get_skills_snapshot()
+        if context.available_skills != skills:
+            capabilities_layer = _capabilities_layer(context.available_skills)
+        layers.append(capabilities_layer)
 
         # Layer 3: Current state and context
         todos_str = json.dumps(context.state.todos, indent=2) if context.state.todos else "[]"
@@ -818,13 +948,14 @@ Sandbox: {context.sandbox.sandbox_id if context.sandbox else 'None'}
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_input}
         ]
+        # The same definitions are offered on every iteration
+        tools = self._build_tool_definitions() if self.llm.supports_tools else None
 
         while iteration < max_iterations:
             iteration += 1
 
             # Generate LLM response
-            if self.llm.supports_tools:
-                tools = self._build_tool_definitions()
+            if tools is not None:
                 response = self.llm.generate(messages, tools=tools)
             else:
                 response = self.llm.generate(messages)
@@ -867,7 +998,7 @@ Sandbox: {context.sandbox.sandbox_id if context.sandbox else 'None'}
         return {
             "agent_id": agent_id,
             "iterations": iteration,
-            "results": [r.to_json() for r in results],
+            "results": [r.to_dict() for r in results],
             "state": state.to_dict(),
             "final_response": messages[-1]["content"] if messages else ""
         }
@@ -925,79 +1056,13 @@ Sandbox: {context.sandbox.sandbox_id if context.sandbox else 'None'}
 
     def _build_tool_definitions(self) -> List[Dict[str, Any]]:
         """Build tool definitions for tool-using LLMs"""
-        tools = [
-            {
-                "name": "file_read",
-                "description": "Read contents of a file",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "path": {"type": "string", "description": "Path to file"}
-                    },
-                    "required": ["path"]
-                }
-            },
-            {
-                "name": "file_write",
-                "description": "Write contents to a file",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "path": {"type": "string"},
-                        "content": {"type": "string"}
-                    },
-                    "required": ["path", "content"]
-                }
-            },
-            {
-                "name": "shell_exec",
-                "description": "Execute a shell command",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "command": {"type": "string"}
-                    },
-                    "required": ["command"]
-                }
-            },
-            {
-                "name": "skill_invoke",
-                "description": "Invoke a skill by ID",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "skill": {"type": "string"},
-                        "params": {"type": "object"}
-                    },
-                    "required": ["skill"]
-                }
-            },
-            {
-                "name": "msg_send",
-                "description": "Send a message to another agent",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "to": {"type": "string"},
-                        "message": {"type": "string"}
-                    },
-                    "required": ["to", "message"]
-                }
-            }
-        ]
-        return tools
+        # A fresh list so callers can append their own tools; the
+        # definitions themselves are shared and must not be mutated
+        return list(_TOOL_DEFINITIONS)
 
     def _check_task_complete(self, state: AgentState, content: str) -> bool:
         """Check if agent indicates task is complete"""
-        complete_indicators = [
-            "task complete",
-            "all done",
-            "finished",
-            "[DONE]",
-            "completed successfully"
-        ]
-        content_lower = content.lower()
-        return any(ind in content_lower for ind in complete_indicators)
+        return _TASK_COMPLETE_PATTERN.search(content) is not None
 
     def get_status(self) -> Dict[str, Any]:
         """Get overall harness status"""
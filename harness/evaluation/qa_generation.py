@@ -31,6 +31,22 @@ from abc import ABC, abstractmethod
 import sqlite3
 import threading
 
+from .._json import json_dumps_bytes
+
+# Write buffer for training-data exports; large corpora otherwise pay one
+# write syscall per default-sized (8 KiB) buffer flush.
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+
+def _jsonl_line(item: Dict[str, Any]) -> bytes:
+    return json_dumps_bytes(item) + b"\n"
+
+
+def _write_jsonl(path: Path, items: List[Dict[str, Any]]):
+    """Write items as JSON Lines through a large binary buffer"""
+    with open(path, "wb", buffering=EXPORT_BUFFER_SIZE) as f:
+        f.writelines(_jsonl_line(item) for item in items)
+
 
 class QAFormat(Enum):
     """Format types for generated Q&A pairs"""
@@ -212,7 +228,7 @@ class InstructionQAGenerator(QAGenerator):
 
         # Create basic instruction pair
         pair = QAPair(
-            qa_id=str(uuid.uuid4())[:12],
+            qa_id=uuid.uuid4().hex[:12],
             created_at=datetime.now(),
             source_trace_id=trace_data.get("trace_id"),
             source_evaluation_id=evaluation_data.get("evaluation_id") if evaluation_data else None,
@@ -233,7 +249,7 @@ class InstructionQAGenerator(QAGenerator):
             variations = self._generate_variations(task)
             for var in variations[:2]:  # Limit variations
                 var_pair = QAPair(
-                    qa_id=str(uuid.uuid4())[:12],
+                    qa_id=uuid.uuid4().hex[:12],
                     created_at=datetime.now(),
                     source_trace_id=trace_data.get("trace_id"),
                     source_evaluation_id=evaluation_data.get("evaluation_id") if evaluation_data else None,
@@ -326,7 +342,7 @@ class ConversationQAGenerator(QAGenerator):
 
         # Create conversation pair
         pair = QAPair(
-            qa_id=str(uuid.uuid4())[:12],
+            qa_id=uuid.uuid4().hex[:12],
             created_at=datetime.now(),
             source_trace_id=trace_data.get("trace_id"),
             source_evaluation_id=evaluation_data.get("evaluation_id") if evaluation_data else None,
@@ -406,7 +422,7 @@ class ReasoningQAGenerator(QAGenerator):
         reasoning_answer += f"\n\nFinal Answer:\n{final_output}"
 
         pair = QAPair(
-            qa_id=str(uuid.uuid4())[:12],
+            qa_id=uuid.uuid4().hex[:12],
             created_at=datetime.now(),
             source_trace_id=trace_data.get("trace_id"),
             source_evaluation_id=evaluation_data.get("evaluation_id") if evaluation_data else None,
@@ -483,7 +499,7 @@ class ToolUseQAGenerator(QAGenerator):
         tool_response += f"\nBased on the tool results: {trace_data.get('final_output', '')[:500]}"
 
         pair = QAPair(
-            qa_id=str(uuid.uuid4())[:12],
+            qa_id=uuid.uuid4().hex[:12],
             created_at=datetime.now(),
             source_trace_id=trace_data.get("trace_id"),
             source_evaluation_id=evaluation_data.get("evaluation_id") if evaluation_data else None,
@@ -567,7 +583,7 @@ class ErrorRecoveryQAGenerator(QAGenerator):
             response += self._suggest_recovery(error_msg)
 
         pair = QAPair(
-            qa_id=str(uuid.uuid4())[:12],
+            qa_id=uuid.uuid4().hex[:12],
             created_at=datetime.now(),
             source_trace_id=trace_data.get("trace_id"),
             source_evaluation_id=evaluation_data.get("evaluation_id") if evaluation_data else None,
@@ -829,9 +845,7 @@ class QAGenerationSystem:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         if output_path.suffix == ".jsonl":
-            with open(output_path, "w") as f:
-                for item in training_data:
-                    f.write(json.dumps(item) + "\n")
+            _write_jsonl(output_path, training_data)
         else:
             with open(output_path, "w") as f:
                 json.dump(training_data, f, indent=2)
@@ -860,13 +874,8 @@ class QAGenerationSystem:
         train_data = [p.to_training_format(style) for p in train_pairs]
         val_data = [p.to_training_format(style) for p in val_pairs]
 
-        with open(output_path / "train.jsonl", "w") as f:
-            for item in train_data:
-                f.write(json.dumps(item) + "\n")
-
-        with open(output_path / "validation.jsonl", "w") as f:
-            for item in val_data:
-                f.write(json.dumps(item) + "\n")
+        _write_jsonl(output_path / "train.jsonl", train_data)
+        _write_jsonl(output_path / "validation.jsonl", val_data)
 
         return {
             "train": len(train_data),
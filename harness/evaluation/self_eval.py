@@ -14,11 +14,13 @@ Inspired by:
 - Meta-learning and few-shot learning
 """
 
+import re
 import json
 import time
 import uuid
 import hashlib
 import threading
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Callable, Tuple, Union
 from datetime import datetime, timedelta
@@ -28,6 +30,10 @@ from abc import ABC, abstractmethod
 import sqlite3
 
 
+# Outermost {...} span in an LLM evaluation response
+_JSON_OBJECT_PATTERN = re.compile(r'\{[\s\S]*\}')
+
+
 class EvaluationDimension(Enum):
     """Dimensions along which agent performance is evaluated"""
     # Task completion
@@ -309,7 +315,7 @@ class RuleBasedEvaluator(Evaluator):
         training_worthy = overall_score >= 0.7 and trace.success
 
         return EvaluationResult(
-            evaluation_id=str(uuid.uuid4())[:12],
+            evaluation_id=uuid.uuid4().hex[:12],
             timestamp=datetime.now(),
             agent_id=trace.agent_id,
             level=EvaluationLevel.TASK,
@@ -412,8 +418,7 @@ Format your response as JSON:
 
         try:
             # Try to extract JSON from response
-            import re
-            json_match = re.search(r'\{[\s\S]*\}', content)
+            json_match = _JSON_OBJECT_PATTERN.search(content)
             if json_match:
                 data = json.loads(json_match.group())
             else:
@@ -429,7 +434,7 @@ Format your response as JSON:
                     scores[c.dimension] = 0.5
 
             return EvaluationResult(
-                evaluation_id=str(uuid.uuid4())[:12],
+                evaluation_id=uuid.uuid4().hex[:12],
                 timestamp=datetime.now(),
                 agent_id=trace.agent_id,
                 level=EvaluationLevel.TASK,
@@ -467,7 +472,7 @@ Format your response as JSON:
         overall = sum(scores.values()) / max(1, len(scores))
 
         return EvaluationResult(
-            evaluation_id=str(uuid.uuid4())[:12],
+            evaluation_id=uuid.uuid4().hex[:12],
             timestamp=datetime.now(),
             agent_id=trace.agent_id,
             level=EvaluationLevel.TASK,
@@ -759,7 +764,7 @@ class SelfEvaluationLoop:
 
         # Build lesson from evaluation
         lesson = Lesson(
-            lesson_id=str(uuid.uuid4())[:12],
+            lesson_id=uuid.uuid4().hex[:12],
             created_at=datetime.now(),
             source_trace_id=trace.trace_id,
             source_evaluation_id=evaluation_id,
@@ -1004,7 +1009,8 @@ class FlywheelManager:
             "lessons_extracted": 0,
             "lessons_applied": 0,
             "training_data_generated": 0,
-            "average_score_trend": []
+            # Bounded: appending past 100 scores drops the oldest in O(1)
+            "average_score_trend": deque(maxlen=100)
         }
 
     def process_execution(
@@ -1027,7 +1033,7 @@ class FlywheelManager:
         """
         # Create execution trace
         trace = ExecutionTrace(
-            trace_id=str(uuid.uuid4())[:12],
+            trace_id=uuid.uuid4().hex[:12],
             agent_id=agent_id,
             session_id=session_id,
             original_task=task,
@@ -1065,8 +1071,6 @@ class FlywheelManager:
 
             # Track score trend
             self.metrics["average_score_trend"].append(evaluation.overall_score)
-            if len(self.metrics["average_score_trend"]) > 100:
-                self.metrics["average_score_trend"] = self.metrics["average_score_trend"][-100:]
 
             # Track training data
             if evaluation.training_worthy:
@@ -1103,7 +1107,7 @@ class FlywheelManager:
     def get_flywheel_status(self) -> Dict[str, Any]:
         """Get current flywheel status and health"""
         avg_score = 0.0
-        trend = self.metrics["average_score_trend"]
+        trend = list(self.metrics["average_score_trend"])
         if trend:
             avg_score = sum(trend) / len(trend)
 
@@ -1118,7 +1122,7 @@ class FlywheelManager:
             trend_direction = "no_data"
 
         return {
-            "metrics": self.metrics,
+            "metrics": {**self.metrics, "average_score_trend": trend},
             "average_score": avg_score,
             "trend_direction": trend_direction,
             "total_lessons": len(self.eval_loop.lessons),
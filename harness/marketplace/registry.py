@@ -15,7 +15,7 @@ Key features:
 """
 
 import json
-import hashlib
+import uuid
 import requests
 from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Set, Tuple
@@ -26,6 +26,8 @@ import threading
 import sqlite3
 from abc import ABC, abstractmethod
 
+from .._compat import RevisionCounter
+
 
 class AssetType(Enum):
     """Types of marketplace assets"""
@@ -131,7 +133,7 @@ class Review:
     helpful_count: int = 0
 
 
-class AgentDirectory:
+class AgentDirectory(RevisionCounter):
     """
     Directory of all registered agents in the system.
     Enables discovery and capability matching.
@@ -163,6 +165,7 @@ class AgentDirectory:
         """Register an agent in the directory"""
         with self._lock:
             self.agents[profile.agent_id] = profile
+            self._bump_revision()
 
             # Update capability index
             for cap in profile.capabilities:
@@ -196,6 +199,7 @@ class AgentDirectory:
                     self.specialization_index[spec].discard(agent_id)
 
             del self.agents[agent_id]
+            self._bump_revision()
             return True
 
     def get(self, agent_id: str) -> Optional[AgentProfile]:
@@ -286,8 +290,10 @@ class AgentDirectory:
         capability_level: AgentCapabilityLevel = None
     ) -> List[AgentProfile]:
         """List all agents with optional filtering"""
+        with self._lock:
+            profiles = list(self.agents.values())
         results = []
-        for profile in self.agents.values():
+        for profile in profiles:
             if status and profile.status != status:
                 continue
             if capability_level and profile.capability_level != capability_level:
@@ -297,11 +303,14 @@ class AgentDirectory:
 
     def update_status(self, agent_id: str, status: str) -> bool:
         """Update agent status"""
-        if agent_id in self.agents:
-            self.agents[agent_id].status = status
-            self.agents[agent_id].last_seen = datetime.now()
+        with self._lock:
+            profile = self.agents.get(agent_id)
+            if profile is None:
+                return False
+            profile.status = status
+            profile.last_seen = datetime.now()
+            self._bump_revision()
             return True
-        return False
 
     def get_capabilities(self) -> List[str]:
         """Get list of all known capabilities"""
@@ -521,7 +530,9 @@ class Marketplace:
             return False
 
         review = Review(
-            review_id=hashlib.sha256(f"{asset_id}-{agent_id}-{datetime.now()}".encode()).hexdigest()[:12],
+            # Random like the harness's other IDs: hashing the agent and a
+            # formatted clock reading collided for same-tick reviews
+            review_id=uuid.uuid4().hex[:12],
             asset_id=asset_id,
             agent_id=agent_id,
             rating=max(1, min(5, rating)),
@@ -534,11 +545,12 @@ class Marketplace:
             self.reviews[asset_id] = []
         self.reviews[asset_id].append(review)
 
-        # Update asset rating
+        # Fold the new rating into the running average instead of re-summing
+        # every review of the asset
         asset = self.assets[asset_id]
-        total_rating = sum(r.rating for r in self.reviews[asset_id])
-        asset.rating = total_rating / len(self.reviews[asset_id])
-        asset.rating_count = len(self.reviews[asset_id])
+        count = asset.rating_count + 1
+        asset.rating = (asset.rating * asset.rating_count + review.rating) / count
+        asset.rating_count = count
 
         return True
 
@@ -383,7 +383,7 @@ class SandboxManager:
     ) -> Optional[Sandbox]:
         """Create a new sandbox"""
         with self._lock:
-            sandbox_id = str(uuid.uuid4())[:8]
+            sandbox_id = uuid.uuid4().hex[:8]
             name = name or f"sandbox-{sandbox_id}"
 
             sandbox = Sandbox(
@@ -431,10 +431,13 @@ class SandboxManager:
             if self.backend.destroy_environment(sandbox):
                 sandbox.status = SandboxStatus.DESTROYED
 
-                # Clean up references
+                # Clean up references: share/revoke keep allowed_agents in
+                # step with agent_sandboxes, so only those entries hold it
                 del self.sandboxes[sandbox_id]
-                for agent_sboxes in self.agent_sandboxes.values():
-                    agent_sboxes.discard(sandbox_id)
+                for member_id in sandbox.allowed_agents:
+                    agent_sboxes = self.agent_sandboxes.get(member_id)
+                    if agent_sboxes is not None:
+                        agent_sboxes.discard(sandbox_id)
 
                 return True
 
@@ -557,7 +560,7 @@ class SandboxManager:
         if not sandbox or sandbox.owner_id != agent_id:
             return None
 
-        snapshot_id = str(uuid.uuid4())[:8]
+        snapshot_id = uuid.uuid4().hex[:8]
         snapshot_path = sandbox.root_path / ".snapshots" / snapshot_id
 
         try:
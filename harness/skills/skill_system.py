@@ -21,14 +21,17 @@ import yaml
 import hashlib
 import importlib.util
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Callable, Union
+from typing import Dict, Any, List, Optional, Callable, Union, Iterator, Tuple
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from itertools import islice
 from abc import ABC, abstractmethod
 import threading
 import inspect
 
+from .._compat import DATACLASS_SLOTS, RevisionCounter
+
 
 class SkillType(Enum):
     """Types of skills"""
@@ -133,7 +136,7 @@ class SkillMetadata:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SkillResult:
     """Result of skill execution"""
     success: bool
@@ -144,12 +147,25 @@ class SkillResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# Python types accepted for each declared parameter type; other types
+# ("object", custom names) are not type-checked
+_PARAM_TYPES = {"string": str, "number": (int, float), "boolean": bool, "array": list}
+
+
+def _param_check(param: SkillParameter) -> tuple:
+    """(name, required, expected type, type name, enum) for validate_params"""
+    return (param.name, param.required, _PARAM_TYPES.get(param.type), param.type, param.enum)
+
+
 class Skill(ABC):
     """Abstract base class for skills"""
 
     def __init__(self, metadata: SkillMetadata):
         self.metadata = metadata
         self._initialized = False
+        # Parameter checks resolved once from the metadata instead of
+        # matching type names on every execute
+        self._param_checks = tuple(_param_check(param) for param in metadata.parameters)
 
     @abstractmethod
     def execute(self, params: Dict[str, Any], context: Dict[str, Any]) -> SkillResult:
@@ -158,25 +174,20 @@ class Skill(ABC):
 
     def validate_params(self, params: Dict[str, Any]) -> tuple[bool, Optional[str]]:
         """Validate parameters against skill definition"""
-        for param_def in self.metadata.parameters:
-            if param_def.required and param_def.name not in params:
-                return False, f"Missing required parameter: {param_def.name}"
-
-            if param_def.name in params:
-                value = params[param_def.name]
-                # Type validation
-                if param_def.type == "string" and not isinstance(value, str):
-                    return False, f"Parameter {param_def.name} must be string"
-                elif param_def.type == "number" and not isinstance(value, (int, float)):
-                    return False, f"Parameter {param_def.name} must be number"
-                elif param_def.type == "boolean" and not isinstance(value, bool):
-                    return False, f"Parameter {param_def.name} must be boolean"
-                elif param_def.type == "array" and not isinstance(value, list):
-                    return False, f"Parameter {param_def.name} must be array"
-
-                # Enum validation
-                if param_def.enum and value not in param_def.enum:
-                    return False, f"Parameter {param_def.name} must be one of {param_def.enum}"
+        for name, required, expected_type, type_name, enum in self._param_checks:
+            if name not in params:
+                if required:
+                    return False, f"Missing required parameter: {name}"
+                continue
+
+            value = params[name]
+            # Type validation
+            if expected_type is not None and not isinstance(value, expected_type):
+                return False, f"Parameter {name} must be {type_name}"
+
+            # Enum validation
+            if enum and value not in enum:
+                return False, f"Parameter {name} must be one of {enum}"
 
         return True, None
 
@@ -217,10 +228,16 @@ class PythonSkill(Skill):
     def __init__(self, metadata: SkillMetadata, func: Callable):
         super().__init__(metadata)
         self.func = func
+        # Whether the function takes a context argument is fixed; check its
+        # signature once here instead of on every execute
+        try:
+            self._wants_context = 'context' in inspect.signature(func).parameters
+        except (TypeError, ValueError):
+            self._wants_context = False
 
     def execute(self, params: Dict[str, Any], context: Dict[str, Any]) -> SkillResult:
         import time
-        start = time.time()
+        start_ns = time.perf_counter_ns()
 
         valid, error = self.validate_params(params)
         if not valid:
@@ -233,14 +250,12 @@ class PythonSkill(Skill):
             )
 
         try:
-            # Check function signature to see if it expects context
-            sig = inspect.signature(self.func)
-            if 'context' in sig.parameters:
+            if self._wants_context:
                 result = self.func(params, context)
             else:
                 result = self.func(params)
 
-            execution_time = (time.time() - start) * 1000
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e6
 
             return SkillResult(
                 success=True,
@@ -253,7 +268,7 @@ class PythonSkill(Skill):
             return SkillResult(
                 success=False,
                 output=None,
-                execution_time_ms=(time.time() - start) * 1000,
+                execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
                 skill_id=self.metadata.skill_id,
                 error=str(e)
             )
@@ -271,7 +286,7 @@ class PromptSkill(Skill):
 
     def execute(self, params: Dict[str, Any], context: Dict[str, Any]) -> SkillResult:
         import time
-        start = time.time()
+        start_ns = time.perf_counter_ns()
 
         valid, error = self.validate_params(params)
         if not valid:
@@ -289,7 +304,7 @@ class PromptSkill(Skill):
             for key, value in params.items():
                 rendered = rendered.replace(f"{{{{{key}}}}}", str(value))
 
-            execution_time = (time.time() - start) * 1000
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e6
 
             return SkillResult(
                 success=True,
@@ -302,7 +317,7 @@ class PromptSkill(Skill):
             return SkillResult(
                 success=False,
                 output=None,
-                execution_time_ms=(time.time() - start) * 1000,
+                execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
                 skill_id=self.metadata.skill_id,
                 error=str(e)
             )
@@ -320,7 +335,7 @@ class CompositeSkill(Skill):
 
     def execute(self, params: Dict[str, Any], context: Dict[str, Any]) -> SkillResult:
         import time
-        start = time.time()
+        start_ns = time.perf_counter_ns()
 
         skill_registry = context.get('skill_registry')
         if not skill_registry:
@@ -333,7 +348,8 @@ class CompositeSkill(Skill):
             )
 
         results = {}
-        current_data = dict(params)
+        # Only read when resolving "$name" references, so no copy is needed
+        current_data = params
 
         for step in self.steps:
             skill_id = step['skill_id']
@@ -359,7 +375,7 @@ class CompositeSkill(Skill):
                 return SkillResult(
                     success=False,
                     output=results,
-                    execution_time_ms=(time.time() - start) * 1000,
+                    execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
                     skill_id=self.metadata.skill_id,
                     error=f"Skill not found: {skill_id}"
                 )
@@ -373,7 +389,7 @@ class CompositeSkill(Skill):
                 return SkillResult(
                     success=False,
                     output=results,
-                    execution_time_ms=(time.time() - start) * 1000,
+                    execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
                     skill_id=self.metadata.skill_id,
                     error=f"Step {skill_id} failed: {result.error}"
                 )
@@ -381,12 +397,12 @@ class CompositeSkill(Skill):
         return SkillResult(
             success=True,
             output=results,
-            execution_time_ms=(time.time() - start) * 1000,
+            execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
             skill_id=self.metadata.skill_id
         )
 
 
-class SkillRegistry:
+class SkillRegistry(RevisionCounter):
     """
     Central registry for all available skills.
     Handles loading, caching, and lookup.
@@ -395,6 +411,9 @@ class SkillRegistry:
     def __init__(self, skills_dir: str = None):
         self.skills: Dict[str, Skill] = {}
         self.skills_dir = Path(skills_dir) if skills_dir else None
+        # Rendered help prompts by skill_id (None: the all-skills listing),
+        # cleared whenever the set of skills changes
+        self._prompt_cache: Dict[Optional[str], str] = {}
         self._lock = threading.Lock()
 
         # Register builtin skills
@@ -513,6 +532,8 @@ Provide a detailed analysis including:
         """Register a skill"""
         with self._lock:
             self.skills[skill.metadata.skill_id] = skill
+            self._bump_revision()
+            self._prompt_cache.clear()
             return True
 
     def unregister(self, skill_id: str) -> bool:
@@ -520,6 +541,8 @@ Provide a detailed analysis including:
         with self._lock:
             if skill_id in self.skills:
                 del self.skills[skill_id]
+                self._bump_revision()
+                self._prompt_cache.clear()
                 return True
             return False
 
@@ -545,6 +568,23 @@ Provide a detailed analysis including:
             results.append(skill.metadata)
         return results
 
+    def iter_skill_summaries(
+        self,
+        category: Optional[Union[SkillCategory, str]] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield (skill_id, description) pairs without building metadata lists"""
+        category = getattr(category, "value", category)
+        with self._lock:
+            skills = list(self.skills.items())
+        summaries = (
+            (skill_id, skill.metadata.description)
+            for skill_id, skill in skills
+            if not category
+            or getattr(skill.metadata.category, "value", skill.metadata.category) == category
+        )
+        return islice(summaries, limit)
+
     def search(self, query: str) -> List[SkillMetadata]:
         """Search skills by name, description, or tags"""
         query_lower = query.lower()
@@ -587,7 +627,7 @@ Provide a detailed analysis including:
             if hasattr(module, 'SKILL_METADATA') and hasattr(module, 'execute'):
                 metadata = module.SKILL_METADATA
                 if isinstance(metadata, dict):
-                    metadata = SkillMetadata(**metadata)
+                    metadata = self._python_skill_metadata(metadata)
 
                 skill = PythonSkill(metadata, module.execute)
                 self.register(skill)
@@ -598,6 +638,22 @@ Provide a detailed analysis including:
 
         return None
 
+    @staticmethod
+    def _python_skill_metadata(data: Dict[str, Any]) -> SkillMetadata:
+        """Build metadata from a module's SKILL_METADATA dict, converting the
+        plain values (enum names, parameter and output dicts) the way the
+        YAML loader does"""
+        data = dict(data)
+        data['skill_type'] = SkillType(data.get('skill_type', 'local'))
+        data['category'] = SkillCategory(data.get('category', 'custom'))
+        data['parameters'] = [
+            p if isinstance(p, SkillParameter) else SkillParameter(**p)
+            for p in data.get('parameters', [])
+        ]
+        output = data.get('output', {'type': 'any', 'description': 'Output'})
+        data['output'] = output if isinstance(output, SkillOutput) else SkillOutput(**output)
+        return SkillMetadata(**data)
+
     def _load_yaml_skill(self, path: Path) -> Optional[Skill]:
         """Load a YAML skill definition"""
         try:
@@ -684,14 +740,26 @@ Provide a detailed analysis including:
 
     def get_skill_prompt(self, skill_id: str) -> str:
         """Get a formatted prompt describing how to use a skill"""
-        skill = self.get_skill(skill_id)
-        if not skill:
-            return f"Skill '{skill_id}' not found"
-
-        return skill.get_help()
+        # Rendered under the lock so a concurrent unregister cannot clear the
+        # cache between the render and the store
+        with self._lock:
+            prompt = self._prompt_cache.get(skill_id)
+            if prompt is None:
+                skill = self.skills.get(skill_id)
+                if not skill:
+                    return f"Skill '{skill_id}' not found"
+                prompt = self._prompt_cache[skill_id] = skill.get_help()
+            return prompt
 
     def get_all_skills_prompt(self) -> str:
         """Generate a prompt listing all available skills"""
+        with self._lock:
+            prompt = self._prompt_cache.get(None)
+            if prompt is None:
+                prompt = self._prompt_cache[None] = self._render_all_skills_prompt()
+            return prompt
+
+    def _render_all_skills_prompt(self) -> str:
         lines = [
             "# Available Skills",
             "",
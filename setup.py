@@ -18,9 +18,13 @@ long_description = ""
 if readme_path.exists():
     long_description = readme_path.read_text()
 
+# Read the version without importing the package
+version_ns = {}
+exec((Path(__file__).parent / "harness" / "_version.py").read_text(), version_ns)
+
 setup(
     name="llm-agent-harness",
-    version="0.1.0",
+    version=version_ns["__version__"],
     description="Universal LLM Agent Harness - A game engine for AI agents",
     long_description=long_description,
     long_description_content_type="text/markdown",
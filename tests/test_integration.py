@@ -131,6 +131,49 @@ class TestHarnessIntegration:
         assert "agent_id" in result
         assert "final_response" in result
 
+    def test_missing_required_param(self, harness):
+        """Test a command missing a required parameter fails before dispatch"""
+        _, state = harness.create_agent(name="TestAgent")
+
+        results = harness.executor.execute(
+            {"name": "file_write", "arguments": {"path": "/tmp/x"}},
+            state.agent_id
+        )
+        assert not results[0].success
+        assert results[0].error.endswith("file.write: content")
+
+    def test_help_served_from_cache(self, harness):
+        """Test repeated help requests reuse the rendered text"""
+        _, state = harness.create_agent(name="TestAgent")
+
+        first = harness.executor.execute("help", state.agent_id)[0].output
+        again = harness.executor.execute("help", state.agent_id)[0].output
+        assert first is again
+
+        skill_help = harness.executor.execute("help file.read", state.agent_id)[0].output
+        assert skill_help is harness.skill_registry.get_skill_prompt("file.read")
+
+    def test_warmup_primes_skills_snapshot(self, harness):
+        """Test warmup fills the caches without running commands"""
+        harness.warmup()
+
+        assert harness._skills_snapshot[0] == harness.skill_registry.revision
+        assert harness.agents == {}
+
+    def test_read_batch_keeps_order(self, harness, temp_dir):
+        """Test a batch of reads returns results in command order"""
+        _, state = harness.create_agent(name="TestAgent")
+        paths = []
+        for i in range(4):
+            path = Path(temp_dir) / f"note{i}.txt"
+            path.write_text(f"note {i}")
+            paths.append(path)
+
+        text = "\n".join(f"```command:file.read\npath: {p}\n```" for p in paths)
+        results = harness.executor.execute(text, state.agent_id)
+
+        assert [r.output for r in results] == [f"note {i}" for i in range(4)]
+
     def test_context_building(self, harness):
         """Test context building"""
         _, state = harness.create_agent(name="TestAgent")
@@ -196,6 +239,61 @@ path: /tmp/test.txt
         assert commands[0].type == CommandType.FILE_READ
         assert commands[0].params.get("path") == "/tmp/test.txt"
 
+    def test_repeated_block_gets_fresh_commands(self):
+        """Test a memoized block parse still yields independent commands"""
+        parser = UniversalCommandParser()
+        text = "```command:file.read\npath: /tmp/test.txt\n```"
+
+        first = parser.parse(text)[0]
+        first.params["path"] = "/changed"
+        second = parser.parse(text)[0]
+
+        assert second.params == {"path": "/tmp/test.txt"}
+        assert second.command_id != first.command_id
+
+        # Nested JSON values are not shared with the cached parse either
+        text = '```command:msg.send\nto: a\nmessage: {"items": [1]}\n```'
+        parser.parse(text)[0].params["message"]["items"].append(2)
+        assert parser.parse(text)[0].params["message"] == {"items": [1]}
+
+    def test_long_reply_skips_match_cache(self):
+        """Test long natural-language replies are matched but not memoized"""
+        from harness.core.command_protocol import NaturalLanguageParser
+        parser = NaturalLanguageParser()
+        text = "read file /tmp/" + "x" * parser.CACHE_MAX_CHARS
+
+        assert parser.parse(text).type == CommandType.FILE_READ
+        assert parser._match.cache_info().currsize == 0
+
+    def test_multiline_block_value(self):
+        """Test multi-line values keep their content up to the delimiter"""
+        from harness.core.command_protocol import TextBlockParser
+
+        text = '''```command:file.write
+path: /tmp/out.py
+content:
+"""
+def f():
+    return 'x = """'
+  """
+count: 2
+```'''
+
+        commands = TextBlockParser().parse(text)
+        assert commands[0].params["content"] == "def f():\n    return 'x = \"\"\"'"
+        assert commands[0].params["count"] == 2
+
+    def test_unterminated_block_markers(self):
+        """Many unterminated block headers are rejected in linear time"""
+        import time
+        from harness.core.command_protocol import TextBlockParser
+
+        text = ("```command:" + "x" * 50) * 2000
+
+        start = time.perf_counter()
+        assert TextBlockParser().parse(text) is None
+        assert time.perf_counter() - start < 1.0
+
     def test_tool_call_parsing(self):
         """Test parsing tool call format"""
         parser = UniversalCommandParser()
@@ -209,6 +307,84 @@ path: /tmp/test.txt
         assert len(commands) == 1
         assert commands[0].type == CommandType.FILE_READ
 
+        # Every tool the harness advertises maps to its command type
+        for name, cmd_type in (("shell_exec", CommandType.SHELL_EXEC),
+                               ("skill_invoke", CommandType.SKILL_INVOKE),
+                               ("msg_send", CommandType.MSG_SEND)):
+            commands = parser.parse({"name": name, "arguments": "{}"})
+            assert commands[0].type == cmd_type
+
+        # Prefixed names are inferred once, then routed directly
+        for _ in range(2):
+            commands = parser.parse({"name": "mcp_read_file", "arguments": {"path": "/a"}})
+            assert commands[0].type == CommandType.FILE_READ
+
+        # Adapter output carries already-decoded arguments
+        commands = parser.parse({"id": "1", "name": "file_read", "arguments": {"path": "/a"}})
+        assert commands[0].params == {"path": "/a"}
+
+    def test_result_json_matches_dict(self):
+        """Test a command result serializes to its dict form"""
+        result = CommandResult("cmd-1", True, output={"lines": [1, 2]}, metadata={"k": "v"})
+        assert json.loads(result.to_json()) == result.to_dict()
+
+        # Outputs orjson rejects still serialize
+        result = CommandResult("cmd-2", True, output={1: "one"})
+        assert json.loads(result.to_json())["output"] == {"1": "one"}
+
+        # Unset metadata serializes the same way on both paths
+        result = CommandResult("cmd-3", False, error="boom")
+        assert json.loads(result.to_json()) == result.to_dict()
+        assert result.to_dict()["metadata"] is None
+
+    def test_json_backends_agree(self, harness):
+        """Test orjson and the stdlib fallback encode API payloads alike"""
+        from harness import _json
+        payloads = [
+            harness.get_status(),
+            {
+                "name": "café ✓",
+                "score": 0.1,
+                "at": datetime(2024, 1, 2, 3, 4, 5, 6),
+                "type": CommandType.FILE_READ,
+                "result": CommandResult("cmd-1", True, output=[1.5, None]),
+            },
+        ]
+
+        saved = _json.orjson
+        _json.orjson = None
+        try:
+            stdlib = [_json.json_dumps_bytes(p) for p in payloads]
+        finally:
+            _json.orjson = saved
+
+        for payload, expected in zip(payloads, stdlib):
+            assert json.loads(_json.json_dumps_bytes(payload)) == json.loads(expected)
+
+        decoded = json.loads(stdlib[1])
+        assert decoded["at"] == "2024-01-02T03:04:05.000006"
+        assert decoded["type"] == "file.read"
+        assert decoded["result"] == CommandResult("cmd-1", True, output=[1.5, None]).to_dict()
+        assert "café ✓" in stdlib[1].decode()
+
+    def test_custom_parser_takes_priority(self):
+        """Test a parser added ahead of the built-ins is consulted first"""
+        from harness.core.command_protocol import CommandParser
+
+        class StatusParser(CommandParser):
+            def can_parse(self, input_data):
+                return input_data == "ping"
+
+            def parse(self, input_data):
+                return Command(type=CommandType.META_STATUS)
+
+        parser = UniversalCommandParser()
+        parser.add_parser(StatusParser(), priority=0)
+
+        assert parser.parse("ping")[0].type == CommandType.META_STATUS
+        assert parser.parse({"name": "file_read", "arguments": {"path": "/a"}})[0].type == \
+            CommandType.FILE_READ
+
     def test_natural_language_parsing(self):
         """Test parsing natural language commands"""
         parser = UniversalCommandParser()
@@ -288,6 +464,17 @@ class TestSandboxManager:
 
         assert success
 
+    def test_destroy_clears_shared_access(self, temp_dir):
+        """Test destroying a shared sandbox drops it for every member"""
+        manager = SandboxManager(temp_dir)
+
+        sandbox = manager.create_sandbox(owner_id="agent-1", name="gone")
+        manager.share_sandbox(sandbox.sandbox_id, "agent-1", "agent-2")
+
+        assert manager.destroy_sandbox(sandbox.sandbox_id, "agent-1")
+        assert sandbox.sandbox_id not in manager.agent_sandboxes["agent-1"]
+        assert sandbox.sandbox_id not in manager.agent_sandboxes["agent-2"]
+
     def test_sandbox_snapshot(self, temp_dir):
         """Test sandbox snapshots"""
         manager = SandboxManager(temp_dir)
@@ -316,6 +503,21 @@ class TestSandboxManager:
 class TestSkillSystem:
     """Test skill system"""
 
+    def test_load_python_skill_module(self, temp_dir):
+        """Test a module declaring SKILL_METADATA as plain dicts loads fully"""
+        from harness.skills.skill_system import EXAMPLE_PYTHON_SKILL
+        skill_file = Path(temp_dir) / "timestamp_skill.py"
+        skill_file.write_text(EXAMPLE_PYTHON_SKILL)
+
+        registry = SkillRegistry(temp_dir)
+        skill = registry.load_from_file(skill_file)
+
+        assert skill is not None
+        assert skill.metadata.parameters[0].name == "format"
+        assert skill.metadata.to_dict()["parameters"][0]["name"] == "format"
+        assert "custom.timestamp" in registry.get_all_skills_prompt()
+        assert registry.execute("custom.timestamp", {"format": "unix"}).success
+
     def test_register_skill(self, temp_dir):
         """Test skill registration"""
         registry = SkillRegistry(temp_dir)
@@ -378,6 +580,27 @@ class TestSkillSystem:
         assert result.success
         assert result.output.get("echo") == "Hello"
 
+    def test_skills_prompt_tracks_registry(self, temp_dir):
+        """Test cached skill prompts are refreshed when skills change"""
+        registry = SkillRegistry(temp_dir)
+
+        assert "file.read" in registry.get_all_skills_prompt()
+        assert registry.get_skill_prompt("file.read").startswith("# Read File")
+
+        registry.unregister("file.read")
+        assert "file.read" not in registry.get_all_skills_prompt()
+        assert registry.get_skill_prompt("file.read") == "Skill 'file.read' not found"
+
+    def test_iter_skill_summaries(self, temp_dir):
+        """Test lightweight skill listing"""
+        registry = SkillRegistry(temp_dir)
+
+        summaries = list(registry.iter_skill_summaries(category="file_operations"))
+        assert ("file.read", "Read contents of a file") in summaries
+        assert all(skill_id.startswith("file.") for skill_id, _ in summaries)
+
+        assert len(list(registry.iter_skill_summaries(limit=2))) == 2
+
 
 class TestMessageBus:
     """Test inter-agent communication"""
@@ -392,6 +615,22 @@ class TestMessageBus:
         assert bus.get_mailbox("agent-1") is not None
         assert bus.get_mailbox("agent-2") is not None
 
+    def test_message_round_trip_and_expiry(self):
+        """Test message timestamps survive to_dict/from_dict and drive expiry"""
+        message = Message(
+            message_id="msg-0",
+            message_type=MessageType.DIRECT,
+            sender_id="agent-1",
+            recipient_id="agent-2",
+            content="ping"
+        )
+        restored = Message.from_dict(message.to_dict())
+        assert restored.timestamp_dt == message.timestamp_dt
+        assert not message.is_expired()
+
+        message.ttl_seconds = -1
+        assert message.is_expired()
+
     def test_send_direct_message(self):
         """Test direct messaging"""
         bus = MessageBus()
@@ -415,6 +654,19 @@ class TestMessageBus:
         assert len(messages) == 1
         assert messages[0].content == "Hello from agent-1"
 
+    def test_send_direct_helper(self):
+        """Test the send_direct convenience method"""
+        bus = MessageBus()
+
+        bus.register_agent("agent-1")
+        bus.register_agent("agent-2")
+
+        assert bus.send_direct("agent-1", "agent-2", "Hi")
+
+        messages = bus.get_mailbox("agent-2").peek_messages(10)
+        assert [m.content for m in messages] == ["Hi"]
+        assert messages[0].message_type == MessageType.DIRECT
+
     def test_broadcast_message(self):
         """Test broadcast messaging"""
         bus = MessageBus()
@@ -462,6 +714,24 @@ class TestMessageBus:
         assert any(m.topic == "updates" for m in messages)
 
 
+    def test_unregister_drops_mailboxless_subscription(self):
+        """Test unregistering clears a subscription made without a mailbox"""
+        bus = MessageBus()
+
+        bus.send(Message(
+            message_id="msg-sub",
+            message_type=MessageType.SUBSCRIBE,
+            sender_id="ghost",
+            recipient_id=None,
+            content=None,
+            topic="updates"
+        ))
+        assert "ghost" in bus.get_topic_subscribers("updates")
+
+        bus.unregister_agent("ghost")
+        assert "ghost" not in bus.get_topic_subscribers("updates")
+
+
 class TestEvaluationSystem:
     """Test self-evaluation and flywheel"""
 
@@ -553,6 +823,11 @@ class TestEvaluationSystem:
         assert "trace_id" in result
         assert "evaluation" in result
 
+        # Status is JSON-ready, the bounded score trend included
+        status = flywheel.get_flywheel_status()
+        assert json.loads(json.dumps(status))["metrics"]["average_score_trend"] == \
+            [result["evaluation"]["overall_score"]]
+
     def test_flywheel_prompt_enhancement(self, temp_dir):
         """Test flywheel prompt enhancement"""
         eval_loop, flywheel = create_evaluation_system(temp_dir)
@@ -651,6 +926,17 @@ class TestQAGeneration:
 class TestMultiAgentScenario:
     """Test multi-agent scenarios"""
 
+    def test_status_update_bumps_directory_revision(self, harness):
+        """Test status changes invalidate cached directory views"""
+        _, state = harness.create_agent(name="Agent1")
+        directory = harness.agent_directory
+        revision = directory.revision
+
+        assert directory.update_status(state.agent_id, "busy")
+        assert directory.revision == revision + 1
+        assert not directory.update_status("missing", "busy")
+        assert directory.revision == revision + 1
+
     def test_collaborative_task(self, harness):
         """Test agents working together"""
         # Create two agents
@@ -778,5 +1064,139 @@ class TestEndToEndScenario:
         assert status["agents"] >= 1
 
 
+class TestPackageImports:
+    """Test lazy package-level exports"""
+
+    def test_partial_import_skips_subsystems(self):
+        """Importing a command type should not load the full harness"""
+        import subprocess
+        code = (
+            "import sys; from harness import Command; "
+            "print('harness.core.llm_harness' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=str(Path(__file__).parent.parent),
+            capture_output=True, text=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_lazy_exports_resolve(self):
+        """Every name in __all__ resolves to the defining module's object"""
+        import harness
+        from harness.core import llm_harness
+
+        for name in harness.__all__:
+            assert getattr(harness, name) is not None
+        assert harness.LLMBackend is llm_harness.LLMBackend
+
+    def test_backend_interface_import_skips_harness(self):
+        """LLMBackend resolves from harness.core.backend alone"""
+        import subprocess
+        code = (
+            "import sys; from harness import LLMBackend; "
+            "from harness.adapters import LLMBackend as AdapterBackend; "
+            "print(LLMBackend is AdapterBackend, "
+            "'harness.core.llm_harness' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=str(Path(__file__).parent.parent),
+            capture_output=True, text=True
+        )
+        assert result.stdout.strip() == "True False"
+
+    def test_core_exports_star_and_dir(self):
+        """harness.core lists its lazy names for star-imports and dir()"""
+        import harness.core
+
+        namespace = {}
+        exec("from harness.core import *", namespace)
+        for name in harness.core.__all__:
+            assert namespace[name] is getattr(harness.core, name)
+            assert name in dir(harness.core)
+
+    def test_adapter_backends_are_llm_backends(self):
+        """Provider backends satisfy the core LLMBackend interface"""
+        import harness.adapters
+        from harness.adapters.base import BaseLLMBackend
+
+        assert harness.adapters.LLMBackend is LLMBackend
+        assert issubclass(BaseLLMBackend, LLMBackend)
+
+    def test_adapter_backend_identity_without_harness(self):
+        """BaseLLMBackend is an LLMBackend before the harness is imported"""
+        import subprocess
+        code = (
+            "import sys; from harness.adapters.base import BaseLLMBackend; "
+            "from harness.core.backend import LLMBackend; "
+            "print(issubclass(BaseLLMBackend, LLMBackend), "
+            "'harness.core.llm_harness' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=str(Path(__file__).parent.parent),
+            capture_output=True, text=True
+        )
+        assert result.stdout.strip() == "True False"
+
+    def test_tool_conversion_reused(self):
+        """The same tool definition converts to the same provider schema"""
+        from harness.adapters.base import convert_tools_to_openai_format
+
+        tools = [{"name": "file_read", "parameters": {"type": "object"}}]
+        first = convert_tools_to_openai_format(tools)
+        assert first[0]["function"]["name"] == "file_read"
+        assert convert_tools_to_openai_format(tools)[0] is first[0]
+        assert convert_tools_to_openai_format([dict(tools[0])])[0] is not first[0]
+
+
+class TestCLI:
+    """Test CLI argument handling"""
+
+    def test_parser_builds_selected_command(self):
+        """Each subcommand parses its own arguments"""
+        from harness.cli import build_parser, _SUBCOMMANDS
+
+        cases = {
+            "providers": (["providers"], {}),
+            "models": (["models"], {}),
+            "interactive": (["interactive", "--agent", "a1", "--mode", "autonomous"],
+                            {"agent": "a1", "mode": "autonomous"}),
+            "run": (["run", "do it", "--autonomous", "--provider", "ollama"],
+                    {"task": "do it", "autonomous": True, "provider": "ollama"}),
+            "server": (["server", "--port", "9000"], {"port": 9000, "host": "127.0.0.1"}),
+            "agent": (["agent", "create", "--name", "bot"],
+                      {"agent_command": "create", "name": "bot"}),
+            "skill": (["skill", "list", "--category", "coding"],
+                      {"skill_command": "list", "category": "coding"}),
+            "sandbox": (["sandbox", "create", "--template", "python"],
+                        {"sandbox_command": "create", "template": "python"}),
+            "eval": (["eval", "export", "--min-score", "0.8"],
+                     {"eval_command": "export", "min_score": 0.8}),
+            "status": (["status"], {}),
+        }
+        assert set(cases) == {name for name, _, _ in _SUBCOMMANDS}
+
+        for name, (argv, expected) in cases.items():
+            parser, _ = build_parser(argv)
+            args = parser.parse_args(argv)
+            assert args.command == name
+            for attr, value in expected.items():
+                assert getattr(args, attr) == value, (name, attr)
+
+    def test_config_assignment_survives_until_saved(self, temp_dir):
+        """Assigning config is not undone by re-reading config.json"""
+        from harness.cli import HarnessCLI
+
+        Path(temp_dir, "config.json").write_text('{"provider": "openai"}')
+        cli = HarnessCLI(base_path=temp_dir)
+
+        cli.config = {"provider": "ollama"}
+        assert cli.config == {"provider": "ollama"}
+        cli._save_config()
+        assert json.loads(cli.config_path.read_text()) == {"provider": "ollama"}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])